@@ -19,11 +19,12 @@ __version__ = "1.0.4"
 try:
     from .stats.descriptives import DescriptiveStatistics
     from .stats.regression import LinearRegression
-    from .stats.correlation import CorrelationAnalysis
+    from .stats.correlation import CorrelationAnalysis, RollingCorrelation
 except ImportError:
     DescriptiveStatistics = None
     LinearRegression = None
     CorrelationAnalysis = None
+    RollingCorrelation = None
 
 try:
     from .visualization.plots import DataVisualizer
@@ -90,6 +91,7 @@ __all__ = [
     'DescriptiveStatistics',
     'LinearRegression',
     'CorrelationAnalysis',
+    'RollingCorrelation',
     'DataVisualizer',
     'DataProcessor',
     'DataValidator',
@@ -2,16 +2,22 @@
 
 from py_stats_toolkit.algorithms import (
     correlation,
+    covariance,
+    dependence,
     descriptive_stats,
     probability,
     regression,
+    resampling,
     variance,
 )
 
 __all__ = [
     'correlation',
+    'covariance',
+    'dependence',
     'regression',
     'descriptive_stats',
     'variance',
-    'probability'
+    'probability',
+    'resampling'
 ]
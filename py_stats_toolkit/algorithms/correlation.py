@@ -1,45 +1,1000 @@
 """Pure correlation algorithms."""
 
-from typing import List, Tuple
+from functools import partial
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
-from scipy import stats
+from numpy.typing import DTypeLike
+from scipy import fft, linalg, stats
+from statsmodels.stats.multitest import multipletests
 
+from py_stats_toolkit.utils.parallel import ParallelProcessor
 
-def compute_correlation_matrix(data: pd.DataFrame, method: str = "pearson") -> pd.DataFrame:
-    """Compute correlation matrix."""
+
+def standardize_columns(X: np.ndarray, dtype: DTypeLike = np.float64, copy: bool = True) -> np.ndarray:
+    """
+    Center columns and scale them to unit Euclidean norm.
+
+    With unit-norm columns the Pearson correlation matrix is simply ``Z.T @ Z``.
+    Constant columns are scaled by NaN so their correlations come out as NaN,
+    matching ``DataFrame.corr``.
+
+    Args:
+        X: 2D array of shape (n_samples, n_features)
+        dtype: Floating point type used for the standardized values
+        copy: If False and ``X`` already has ``dtype``, standardize in place
+
+    Returns:
+        Standardized array (``X`` itself when standardized in place)
+    """
+    Z = np.array(X, dtype=dtype) if copy else np.asarray(X, dtype=dtype)
+    mean = Z.mean(axis=0, dtype=np.float64)
+    Z -= mean.astype(dtype, copy=False)
+    norm = np.sqrt(np.einsum('ij,ij->j', Z, Z, dtype=np.float64))
+    norm[norm == 0] = np.nan
+    Z /= norm.astype(dtype, copy=False)
+    return Z
+
+
+def compute_pearson_gemm(X: np.ndarray, dtype: DTypeLike = np.float64, copy: bool = True) -> np.ndarray:
+    """
+    Compute the Pearson correlation matrix with a single matrix product.
+
+    Args:
+        X: 2D array of shape (n_samples, n_features) without missing values
+        dtype: Accumulation type (np.float32 halves memory and doubles BLAS throughput)
+        copy: If False, ``X`` is standardized in place when it already has ``dtype``
+
+    Returns:
+        Correlation matrix of shape (n_features, n_features) as float64
+    """
+    Z = standardize_columns(X, dtype=dtype, copy=copy)
+    corr = np.asarray(Z.T @ Z, dtype=np.float64)
+    np.clip(corr, -1.0, 1.0, out=corr)
+    valid = ~np.isnan(np.diagonal(corr))
+    corr[valid, valid] = 1.0
+    return corr
+
+
+def compute_pearson_pairwise_complete(X: np.ndarray, min_periods: int = 1,
+                                      dtype: DTypeLike = np.float64) -> np.ndarray:
+    """
+    Compute exact pairwise-complete Pearson correlations with masked matrix products.
+
+    With ``M`` the observation mask and ``X0`` the data with missing values set
+    to zero, the pairwise counts, sums, sums of squares and cross-products are
+    ``M.T @ M``, ``X0.T @ M``, ``(X0**2).T @ M`` and ``X0.T @ X0``.
+
+    Args:
+        X: 2D array of shape (n_samples, n_features), NaN marking missing values
+        min_periods: Minimum number of complete pairs required for a result
+        dtype: Accumulation type of the matrix products
+
+    Returns:
+        Correlation matrix of shape (n_features, n_features)
+    """
+    X0 = np.array(X, dtype=dtype)
+    observed = ~np.isnan(X0)
+    # Centering on the available-case means keeps the moment formulas stable
+    X0 -= np.nanmean(X0, axis=0, dtype=np.float64).astype(dtype)
+    X0[~observed] = 0
+    mask = observed.astype(dtype)
+
+    n = np.asarray(mask.T @ mask, dtype=np.float64)
+    sums = np.asarray(X0.T @ mask, dtype=np.float64)
+    squares = np.asarray((X0 * X0).T @ mask, dtype=np.float64)
+    cross = np.asarray(X0.T @ X0, dtype=np.float64)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cov = cross - sums * sums.T / n
+        var_x = squares - sums ** 2 / n
+        var_y = var_x.T
+        corr = cov / np.sqrt(var_x * var_y)
+
+    corr[(n < max(min_periods, 2)) | (var_x <= 0) | (var_y <= 0)] = np.nan
+    np.clip(corr, -1.0, 1.0, out=corr)
+    valid = ~np.isnan(np.diagonal(corr))
+    corr[valid, valid] = 1.0
+    return corr
+
+
+DEFAULT_MEMORY_BUDGET = 1 << 30
+WINDOW_BLOCK_ROWS = 1 << 12
+
+
+def _open_matrix(X: Union[np.ndarray, str]) -> np.ndarray:
+    """Open a 2D input, memory-mapping it when given a ``.npy`` path."""
+    if isinstance(X, str):
+        return np.load(X, mmap_mode='r')
+    return X
+
+
+def compute_column_moments(X: Union[np.ndarray, str],
+                           memory_budget: int = DEFAULT_MEMORY_BUDGET) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute column means and centered norms in one pass over row chunks.
+
+    Chunks are merged with the parallel variance update, so the input never
+    has to be loaded (or converted to float64) as a whole.
+
+    Args:
+        X: 2D array, memory-mapped array or path to a ``.npy`` file
+        memory_budget: Approximate number of bytes a float64 row chunk may use
+
+    Returns:
+        Tuple of (means, norms) where ``norms**2`` is the centered sum of squares
+    """
+    X = _open_matrix(X)
+    n_rows, n_cols = X.shape
+    chunk_rows = max(1, memory_budget // (8 * max(1, n_cols)))
+
+    count = 0
+    mean = np.zeros(n_cols)
+    m2 = np.zeros(n_cols)
+    for start in range(0, n_rows, chunk_rows):
+        chunk = np.array(X[start:start + chunk_rows], dtype=np.float64)
+        n_chunk = chunk.shape[0]
+        chunk_mean = chunk.mean(axis=0)
+        chunk -= chunk_mean
+        chunk_m2 = np.einsum('ij,ij->j', chunk, chunk)
+        delta = chunk_mean - mean
+        total = count + n_chunk
+        mean += delta * (n_chunk / total)
+        m2 += chunk_m2 + delta ** 2 * (count * n_chunk / total)
+        count = total
+
+    return mean, np.sqrt(m2)
+
+
+def _block_width(n_rows: int, n_cols: int, itemsize: int, memory_budget: int) -> int:
+    """Largest column block whose two standardized panels and tile fit the budget."""
+    width = n_cols
+    while width > 1 and 2 * n_rows * width * itemsize + 8 * width * width > memory_budget:
+        width = (width + 1) // 2
+    return width
+
+
+def iter_correlation_blocks(X: Union[np.ndarray, str], block_size: Optional[int] = None,
+                            memory_budget: int = DEFAULT_MEMORY_BUDGET,
+                            dtype: DTypeLike = np.float64) -> Iterator[Tuple[int, int, int, int, np.ndarray]]:
+    """
+    Stream the upper triangle of the Pearson correlation matrix tile by tile.
+
+    Only two standardized column panels of ``block_size`` columns are held in
+    memory at any time, so the input may be a memory-mapped matrix much larger
+    than RAM.
+
+    Args:
+        X: 2D array, memory-mapped array or path to a ``.npy`` file
+        block_size: Columns per block (derived from ``memory_budget`` if None)
+        memory_budget: Approximate number of bytes the panels may use
+        dtype: Accumulation type of the tile products
+
+    Yields:
+        Tuples ``(row_start, row_stop, col_start, col_stop, tile)`` with
+        ``row_start <= col_start``; ``tile`` is a float64 array
+    """
+    X = _open_matrix(X)
+    n_rows, n_cols = X.shape
+    if block_size is None:
+        block_size = _block_width(n_rows, n_cols, np.dtype(dtype).itemsize, memory_budget)
+    block_size = max(1, int(block_size))
+
+    mean, norm = compute_column_moments(X, memory_budget)
+    norm[norm == 0] = np.nan
+
+    def load_panel(start: int, stop: int) -> np.ndarray:
+        panel = np.array(X[:, start:stop], dtype=dtype)
+        panel -= mean[start:stop].astype(dtype)
+        panel /= norm[start:stop].astype(dtype)
+        return panel
+
+    for i0 in range(0, n_cols, block_size):
+        i1 = min(i0 + block_size, n_cols)
+        left = load_panel(i0, i1)
+        for j0 in range(i0, n_cols, block_size):
+            j1 = min(j0 + block_size, n_cols)
+            right = left if j0 == i0 else load_panel(j0, j1)
+            tile = np.asarray(left.T @ right, dtype=np.float64)
+            np.clip(tile, -1.0, 1.0, out=tile)
+            if j0 == i0:
+                diag = np.arange(i1 - i0)
+                tile[diag, diag] = np.where(np.isnan(norm[i0:i1]), np.nan, 1.0)
+            yield i0, i1, j0, j1, tile
+
+
+def compute_correlation_blocked(X: Union[np.ndarray, str],
+                                out: Union[np.ndarray, str, None] = None,
+                                block_size: Optional[int] = None,
+                                memory_budget: int = DEFAULT_MEMORY_BUDGET,
+                                dtype: DTypeLike = np.float64) -> np.ndarray:
+    """
+    Compute the Pearson correlation matrix tile by tile into ``out``.
+
+    Args:
+        X: 2D array, memory-mapped array or path to a ``.npy`` file
+        out: Output (n_features, n_features) array, or a ``.npy`` path that is
+            created as a memory-mapped float64 matrix; allocated in RAM if None
+        block_size: Columns per block (derived from ``memory_budget`` if None)
+        memory_budget: Approximate number of bytes the panels may use
+        dtype: Accumulation type of the tile products
+
+    Returns:
+        The filled correlation matrix (``out`` itself when provided)
+    """
+    X = _open_matrix(X)
+    n_cols = X.shape[1]
+    if out is None:
+        out = np.empty((n_cols, n_cols))
+    elif isinstance(out, str):
+        out = np.lib.format.open_memmap(out, mode='w+', dtype=np.float64,
+                                        shape=(n_cols, n_cols))
+    elif out.shape != (n_cols, n_cols):
+        raise ValueError(f"Output must have shape {(n_cols, n_cols)}, got {out.shape}")
+
+    for i0, i1, j0, j1, tile in iter_correlation_blocks(X, block_size, memory_budget, dtype):
+        out[i0:i1, j0:j1] = tile
+        if j0 != i0:
+            out[j0:j1, i0:i1] = tile.T
+
+    if isinstance(out, np.memmap):
+        out.flush()
+    return out
+
+
+class CorrelationAccumulator:
+    """
+    Running co-moment accumulator for covariance and correlation matrices.
+
+    Keeps the row count, the column means and the centered cross-product
+    matrix. Appending ``k`` rows costs O(k * p^2) regardless of how many rows
+    were seen before, and accumulators built on disjoint data can be merged.
+    """
+
+    def __init__(self, n_features: Optional[int] = None, dtype: DTypeLike = np.float64):
+        """
+        Initialize an empty accumulator.
+
+        Args:
+            n_features: Number of columns (inferred from the first update if None)
+            dtype: Accumulation type of the cross-product update
+        """
+        self.dtype = dtype
+        self.count = 0
+        self.mean = None if n_features is None else np.zeros(n_features)
+        self.comoment = None if n_features is None else np.zeros((n_features, n_features))
+        self._workspace = None
+
+    def _get_workspace(self, n_features: int) -> np.ndarray:
+        """Return a reusable p x p scratch matrix."""
+        if self._workspace is None or self._workspace.shape[0] != n_features:
+            self._workspace = np.empty((n_features, n_features))
+        return self._workspace
+
+    def _combine(self, count: int, mean: np.ndarray, comoment: np.ndarray) -> None:
+        """Merge summary statistics of another sample into this one, in place."""
+        if self.count == 0:
+            self.count, self.mean = count, mean.copy()
+            self.comoment = np.array(comoment, dtype=np.float64)
+            return
+        if mean.shape != self.mean.shape:
+            raise ValueError(
+                f"Expected {self.mean.shape[0]} features, got {mean.shape[0]}"
+            )
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * (count / total)
+        self.comoment += comoment
+        # comoment may be the workspace itself, which is free again from here on
+        correction = self._get_workspace(delta.shape[0])
+        np.multiply.outer(delta, delta * (self.count * count / total), out=correction)
+        self.comoment += correction
+        self.count = total
+
+    def update(self, rows: Union[pd.DataFrame, np.ndarray]) -> "CorrelationAccumulator":
+        """
+        Add a batch of rows.
+
+        Args:
+            rows: 2D array or DataFrame of shape (n_rows, n_features)
+
+        Returns:
+            Self for method chaining
+        """
+        rows = np.array(rows, dtype=self.dtype, ndmin=2)
+        if rows.shape[0] == 0:
+            return self
+        if np.isnan(rows).any():
+            raise ValueError("Rows must not contain missing values")
+        mean = rows.mean(axis=0, dtype=np.float64)
+        rows -= mean.astype(self.dtype)
+        comoment = self._get_workspace(rows.shape[1])
+        np.matmul(rows.T, rows, out=comoment)
+        self._combine(rows.shape[0], mean, comoment)
+        return self
+
+    def merge(self, other: "CorrelationAccumulator") -> "CorrelationAccumulator":
+        """
+        Merge another accumulator built on disjoint rows.
+
+        Args:
+            other: Accumulator to merge into this one
+
+        Returns:
+            Self for method chaining
+        """
+        if other.count:
+            self._combine(other.count, other.mean, other.comoment)
+        return self
+
+    def covariance(self, ddof: int = 1) -> np.ndarray:
+        """Return the covariance matrix of all rows seen so far."""
+        if self.count <= ddof:
+            raise ValueError("Not enough rows to compute a covariance matrix")
+        return self.comoment / (self.count - ddof)
+
+    def correlation(self) -> np.ndarray:
+        """Return the Pearson correlation matrix of all rows seen so far."""
+        if self.count < 2:
+            raise ValueError("Not enough rows to compute a correlation matrix")
+        scale = np.sqrt(np.diagonal(self.comoment)).copy()
+        scale[scale == 0] = np.nan
+        corr = self.comoment / np.outer(scale, scale)
+        np.clip(corr, -1.0, 1.0, out=corr)
+        valid = ~np.isnan(scale)
+        corr[valid, valid] = 1.0
+        return corr
+
+
+def _rank_block(block: np.ndarray) -> np.ndarray:
+    """Rank the columns of one block, averaging ties."""
+    return stats.rankdata(block, method='average', axis=0)
+
+
+def rank_columns(X: np.ndarray, n_jobs: int = 1) -> np.ndarray:
+    """
+    Rank every column once, assigning tied values their average rank.
+
+    Args:
+        X: 2D array of shape (n_samples, n_features)
+        n_jobs: Number of worker processes sharing the columns (-1 for all cores)
+
+    Returns:
+        Float64 array of ranks with the shape of ``X``
+    """
+    X = np.asarray(X)
+    processor = ParallelProcessor(n_jobs=n_jobs)
+    if processor.n_jobs == 1 or X.shape[1] < 2:
+        return _rank_block(X)
+
+    blocks = np.array_split(X, min(processor.n_jobs, X.shape[1]), axis=1)
+    return np.hstack(processor.parallel_map(_rank_block, blocks, min_items=2))
+
+
+def compute_spearman_matrix(X: np.ndarray, dtype: DTypeLike = np.float64, n_jobs: int = 1) -> np.ndarray:
+    """
+    Compute the Spearman correlation matrix as Pearson on column ranks.
+
+    Args:
+        X: 2D array of shape (n_samples, n_features) without missing values
+        dtype: Accumulation type of the Pearson engine
+        n_jobs: Number of worker processes used for ranking
+
+    Returns:
+        Correlation matrix of shape (n_features, n_features)
+    """
+    ranks = rank_columns(X, n_jobs=n_jobs)
+    return compute_pearson_gemm(ranks, dtype=dtype, copy=False)
+
+
+def compute_spearman_test(x: np.ndarray, y: np.ndarray) -> Tuple[float, float]:
+    """Compute Spearman's rho and its two-sided p-value from shared column ranks."""
+    ranks = rank_columns(np.column_stack([x, y]))
+    n = ranks.shape[0]
+    rho = compute_pearson_gemm(ranks)[0, 1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t_stat = rho * np.sqrt((n - 2) / ((1.0 - rho) * (1.0 + rho)))
+    p_value = 2 * stats.t.sf(np.abs(t_stat), n - 2)
+    return float(rho), float(p_value)
+
+
+def _sum_smaller_before(ranks: np.ndarray, weights: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    For every position ``i``, sum ``weights[j]`` over ``j < i`` with ``ranks[j] < ranks[i]``.
+
+    Works bit by bit from the most significant bit of the (non-negative
+    integer) ranks: a qualifying pair is counted exactly once, at the first bit
+    where the two ranks differ. Each level is a stable partition done with
+    cumulative sums, so the whole computation is O(n log n) like a merge sort.
+    ``weights`` may be 2D of shape (n, k) to accumulate k weightings at once.
+    """
+    n = len(ranks)
+    seq_weight = np.ones(n) if weights is None else np.array(weights, dtype=np.float64)
+    result = np.zeros(seq_weight.shape)
+    if n == 0:
+        return result
+
+    seq_rank = np.array(ranks, dtype=np.int64)
+    seq_pos = np.arange(n)
+    index = np.arange(n)
+    extra_axes = (slice(None),) + (None,) * (seq_weight.ndim - 1)
+
+    for b in range(int(seq_rank.max()).bit_length() - 1, -1, -1):
+        bit = (seq_rank >> b) & 1
+        prefix = seq_rank >> (b + 1)
+        is_start = np.empty(n, dtype=bool)
+        is_start[0] = True
+        np.not_equal(prefix[1:], prefix[:-1], out=is_start[1:])
+        start = np.maximum.accumulate(np.where(is_start, index, 0))
+        group = np.cumsum(is_start) - 1
+
+        ones = bit == 1
+        zero_weight = np.where(ones[extra_axes], 0.0, seq_weight)
+        weight_before = np.cumsum(zero_weight, axis=0) - zero_weight
+        result[seq_pos[ones]] += (weight_before - weight_before[start])[ones]
+
+        zero_flag = 1 - bit
+        zeros_before = np.cumsum(zero_flag) - zero_flag
+        zeros_before -= zeros_before[start]
+        zeros_in_group = np.bincount(group, weights=zero_flag).astype(np.int64)
+        new_pos = np.where(
+            ones,
+            start + zeros_in_group[group] + (index - start - zeros_before),
+            start + zeros_before,
+        )
+        for seq in (seq_rank, seq_weight, seq_pos):
+            seq[new_pos] = seq.copy()
+
+    return result
+
+
+def _tied_pairs(sorted_keys: np.ndarray) -> int:
+    """Count pairs of equal values in an already sorted sequence."""
+    if len(sorted_keys) == 0:
+        return 0
+    is_start = np.r_[True, sorted_keys[1:] != sorted_keys[:-1]]
+    runs = np.diff(np.r_[np.flatnonzero(is_start), len(sorted_keys)])
+    return int((runs * (runs - 1) // 2).sum())
+
+
+def _kendall_row(i: int, dense: np.ndarray, tied: np.ndarray) -> np.ndarray:
+    """Compute tau-b of column ``i`` against every later column (Knight's algorithm)."""
+    n, n_cols = dense.shape
+    n0 = n * (n - 1) // 2
+    x = dense[:, i]
+    x_order = np.argsort(x, kind='stable')
+    x_has_ties = tied[i] > 0
+    row = np.full(n_cols, np.nan)
+
+    for j in range(i + 1, n_cols):
+        y = dense[:, j]
+        order = np.lexsort((y, x)) if x_has_ties else x_order
+        y_sorted = y[order]
+        discordant = _sum_smaller_before(y_sorted.max() - y_sorted).sum()
+        joint = _tied_pairs(x[order] * (y.max() + 1) + y_sorted) if x_has_ties else 0
+        denominator = np.sqrt(float(n0 - tied[i]) * float(n0 - tied[j]))
+        if denominator > 0:
+            row[j] = (n0 - tied[i] - tied[j] + joint - 2 * discordant) / denominator
+
+    return row
+
+
+def compute_kendall_matrix(X: np.ndarray, n_jobs: int = 1) -> np.ndarray:
+    """
+    Compute the Kendall tau-b correlation matrix in O(n log n) per pair.
+
+    Each row of the matrix sorts its column once; discordant pairs are then
+    counted with a merge-sort style pass instead of comparing all n^2 pairs.
+    Rows are distributed over a process pool when ``n_jobs != 1``.
+
+    Args:
+        X: 2D array of shape (n_samples, n_features) without missing values
+        n_jobs: Number of worker processes (-1 for all cores)
+
+    Returns:
+        Correlation matrix of shape (n_features, n_features)
+    """
+    X = np.asarray(X)
+    n_cols = X.shape[1]
+    dense = np.empty(X.shape, dtype=np.int64)
+    tied = np.empty(n_cols, dtype=np.int64)
+    for k in range(n_cols):
+        _, dense[:, k], counts = np.unique(X[:, k], return_inverse=True, return_counts=True)
+        tied[k] = (counts * (counts - 1) // 2).sum()
+
+    rows = ParallelProcessor(n_jobs=n_jobs).parallel_map(
+        partial(_kendall_row, dense=dense, tied=tied), list(range(n_cols)), min_items=2
+    )
+    corr = np.vstack(rows) if rows else np.empty((0, 0))
+    upper = np.triu_indices(n_cols, k=1)
+    corr[upper[1], upper[0]] = corr[upper]
+    np.fill_diagonal(corr, np.where(tied < X.shape[0] * (X.shape[0] - 1) // 2, 1.0, np.nan))
+    return np.clip(corr, -1.0, 1.0)
+
+
+PAIR_DTYPE = np.dtype([('i', np.intp), ('j', np.intp), ('r', np.float64)])
+
+
+def _select_tile_pairs(tile: np.ndarray, row_offset: int, col_offset: int,
+                       threshold: Optional[float], top_k: Optional[int],
+                       upper_only: bool) -> np.ndarray:
+    """Extract the qualifying (i, j, r) entries of one correlation tile."""
+    strength = np.abs(tile)
+    strength[np.isnan(strength)] = -np.inf
+    if upper_only:
+        strength[np.tril_indices(tile.shape[0], k=0, m=tile.shape[1])] = -np.inf
+
+    flat = strength.ravel()
+    if threshold is not None:
+        candidates = np.flatnonzero(flat >= threshold)
+    else:
+        candidates = np.flatnonzero(flat > -np.inf)
+    if top_k is not None and candidates.size > top_k:
+        keep = np.argpartition(-flat[candidates], top_k - 1)[:top_k]
+        candidates = np.sort(candidates[keep])
+
+    rows, cols = np.divmod(candidates, tile.shape[1])
+    pairs = np.empty(candidates.size, dtype=PAIR_DTYPE)
+    pairs['i'] = rows + row_offset
+    pairs['j'] = cols + col_offset
+    pairs['r'] = tile.ravel()[candidates]
+    return pairs
+
+
+def _rank_pairs(pairs: np.ndarray, top_k: Optional[int]) -> np.ndarray:
+    """Order pairs by decreasing absolute correlation, keeping at most ``top_k``."""
+    order = np.argsort(-np.abs(pairs['r']), kind='stable')
+    if top_k is not None:
+        order = order[:top_k]
+    return pairs[order]
+
+
+def select_pairs(corr: np.ndarray, threshold: Optional[float] = None,
+                 top_k: Optional[int] = None) -> np.ndarray:
+    """
+    Select variable pairs from an existing correlation matrix.
+
+    Args:
+        corr: Square correlation matrix
+        threshold: Minimum absolute correlation (no limit if None)
+        top_k: Maximum number of pairs to return (all if None)
+
+    Returns:
+        Structured array with fields ``i``, ``j`` (i < j) and ``r``, sorted by
+        decreasing absolute correlation
+    """
+    pairs = _select_tile_pairs(np.array(corr, dtype=np.float64), 0, 0, threshold, top_k, True)
+    return _rank_pairs(pairs, top_k)
+
+
+def find_correlated_pairs(X: Union[np.ndarray, str], threshold: Optional[float] = None,
+                          top_k: Optional[int] = None, block_size: Optional[int] = None,
+                          memory_budget: int = DEFAULT_MEMORY_BUDGET,
+                          dtype: DTypeLike = np.float64) -> np.ndarray:
+    """
+    Find the most strongly correlated column pairs without building the full matrix.
+
+    Tiles from ``iter_correlation_blocks`` are screened as they are produced:
+    entries under ``threshold`` are dropped and ``np.argpartition`` keeps only
+    the running ``top_k`` candidates, so memory stays bounded by the tile size.
+
+    Args:
+        X: 2D array, memory-mapped array or path to a ``.npy`` file
+        threshold: Minimum absolute correlation (no limit if None)
+        top_k: Maximum number of pairs to return (all if None)
+        block_size: Columns per block (derived from ``memory_budget`` if None)
+        memory_budget: Approximate number of bytes the panels may use
+        dtype: Accumulation type of the tile products
+
+    Returns:
+        Structured array with fields ``i``, ``j`` (i < j) and ``r``, sorted by
+        decreasing absolute correlation
+    """
+    if top_k is not None and top_k < 1:
+        raise ValueError(f"top_k must be a positive integer, got {top_k}")
+
+    found = [np.empty(0, dtype=PAIR_DTYPE)]
+    for i0, i1, j0, j1, tile in iter_correlation_blocks(X, block_size, memory_budget, dtype):
+        found.append(_select_tile_pairs(tile, i0, j0, threshold, top_k, i0 == j0))
+        if top_k is not None and sum(len(f) for f in found) > 2 * top_k:
+            found = [_rank_pairs(np.concatenate(found), top_k)]
+
+    return _rank_pairs(np.concatenate(found), top_k)
+
+
+def _is_numeric_frame(data: pd.DataFrame) -> bool:
+    """Check that every column can be used by the matrix engines."""
+    return all(pd.api.types.is_numeric_dtype(dtype) for dtype in data.dtypes)
+
+
+def compute_correlation_matrix(data: pd.DataFrame, method: str = "pearson",
+                               dtype: DTypeLike = np.float64, n_jobs: int = 1) -> pd.DataFrame:
+    """
+    Compute correlation matrix.
+
+    Complete numeric data with ``method="pearson"`` or ``"spearman"`` goes
+    through the GEMM engine (on ranks for Spearman) and ``"kendall"`` through
+    the merge-sort engine. Pearson with missing values uses the masked
+    pairwise-complete engine; everything else is delegated to ``DataFrame.corr``.
+    """
+    if method in ("pearson", "spearman", "kendall") and _is_numeric_frame(data):
+        values = data.to_numpy(dtype=dtype if method == "pearson" else np.float64, copy=True)
+        if method == "pearson" and np.isnan(values).any():
+            corr = compute_pearson_pairwise_complete(values, dtype=dtype)
+            return pd.DataFrame(corr, index=data.columns, columns=data.columns)
+        if not np.isnan(values).any():
+            if method == "kendall":
+                corr = compute_kendall_matrix(values, n_jobs=n_jobs)
+            elif method == "spearman":
+                corr = compute_spearman_matrix(values, dtype=dtype, n_jobs=n_jobs)
+            else:
+                corr = compute_pearson_gemm(values, dtype=dtype, copy=False)
+            return pd.DataFrame(corr, index=data.columns, columns=data.columns)
     return data.corr(method=method)
 
 
+def compute_pairwise_counts(data: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+    """Count the rows where both columns of every pair are observed (``M.T @ M``)."""
+    observed = (~np.isnan(np.asarray(data, dtype=np.float64))).astype(np.float64)
+    return observed.T @ observed
+
+
+def compute_correlation_pvalues(corr: np.ndarray, n: Union[np.ndarray, int],
+                                method: str = "pearson", confidence: float = 0.95,
+                                adjust: Optional[str] = None) -> Dict[str, np.ndarray]:
+    """
+    Compute two-sided p-values and confidence intervals for every matrix cell.
+
+    Pearson and Spearman use the t-distribution with n - 2 degrees of freedom,
+    Kendall the normal approximation of tau. Intervals come from the Fisher z
+    transform (with the usual 1.06 and 0.437 variance factors for Spearman and
+    Kendall).
+
+    Args:
+        corr: Square correlation matrix
+        n: Pairwise number of observations (matrix or scalar)
+        method: Correlation method ('pearson', 'spearman', 'kendall')
+        confidence: Confidence level of the intervals
+        adjust: Optional multiple-testing correction applied to the upper
+            triangle (any ``statsmodels`` ``multipletests`` method, e.g.
+            'bonferroni', 'holm', 'fdr_bh')
+
+    Returns:
+        Dictionary with 'p_values', 'ci_lower' and 'ci_upper' matrices
+    """
+    r = np.clip(np.asarray(corr, dtype=np.float64), -1.0, 1.0)
+    n = np.broadcast_to(np.asarray(n, dtype=np.float64), r.shape)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if method in ("pearson", "spearman"):
+            t_stat = r * np.sqrt((n - 2) / ((1.0 - r) * (1.0 + r)))
+            p_values = 2 * stats.t.sf(np.abs(t_stat), n - 2)
+            variance = {"pearson": 1.0, "spearman": 1.06}[method] / (n - 3)
+        elif method == "kendall":
+            z_stat = 3 * r * np.sqrt(n * (n - 1)) / np.sqrt(2 * (2 * n + 5))
+            p_values = 2 * stats.norm.sf(np.abs(z_stat))
+            variance = 0.437 / (n - 4)
+        else:
+            raise ValueError(f"Unknown method: {method}")
+
+        z_crit = stats.norm.ppf(0.5 + confidence / 2)
+        z = np.arctanh(r)
+        half_width = z_crit * np.sqrt(np.where(variance > 0, variance, np.nan))
+        ci_lower = np.tanh(z - half_width)
+        ci_upper = np.tanh(z + half_width)
+
+    p_values = np.where(np.abs(r) == 1.0, 0.0, p_values)
+    p_values[np.isnan(r) | (n < 3)] = np.nan
+
+    if adjust is not None:
+        i, j = np.triu_indices(r.shape[0], k=1)
+        tested = ~np.isnan(p_values[i, j])
+        adjusted = np.full(i.size, np.nan)
+        if tested.any():
+            adjusted[tested] = multipletests(p_values[i, j][tested], method=adjust)[1]
+        p_values[i, j] = adjusted
+        p_values[j, i] = adjusted
+
+    return {'p_values': p_values, 'ci_lower': ci_lower, 'ci_upper': ci_upper}
+
+
+def compute_correlation_with_target(X: np.ndarray, y: np.ndarray, method: str = "pearson",
+                                    n_jobs: int = 1) -> Dict[str, np.ndarray]:
+    """
+    Correlate every column of ``X`` with one target in a single matrix-vector product.
+
+    Spearman ranks all columns and the target once and reuses the Pearson
+    path; Kendall falls back to one scipy call per column.
+
+    Args:
+        X: 2D array of shape (n_samples, n_features)
+        y: 1D target of length n_samples
+        method: Correlation method ('pearson', 'spearman', 'kendall')
+        n_jobs: Number of worker processes used for ranking
+
+    Returns:
+        Dictionary with 'correlation' and 'p_value' arrays of length n_features
+    """
+    X = np.asarray(X, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64).ravel()
+    if X.ndim != 2 or X.shape[0] != y.shape[0]:
+        raise ValueError(f"X must be 2D with {y.shape[0]} rows, got shape {X.shape}")
+
+    if method == "kendall":
+        results = [stats.kendalltau(X[:, k], y) for k in range(X.shape[1])]
+        return {
+            'correlation': np.array([r[0] for r in results], dtype=np.float64),
+            'p_value': np.array([r[1] for r in results], dtype=np.float64),
+        }
+    if method == "spearman":
+        X = rank_columns(X, n_jobs=n_jobs)
+        y = rank_columns(y[:, None])[:, 0]
+    elif method != "pearson":
+        raise ValueError(f"Unknown method: {method}")
+
+    Z = standardize_columns(X, copy=method == "pearson")
+    z = standardize_columns(y[:, None])[:, 0]
+    correlation = np.clip(Z.T @ z, -1.0, 1.0)
+    p_values = compute_correlation_pvalues(correlation, y.shape[0], method)['p_values']
+    return {'correlation': correlation, 'p_value': p_values}
+
+
+def compute_correlation_matrix_test(data: pd.DataFrame, method: str = "pearson",
+                                    confidence: float = 0.95, adjust: Optional[str] = None,
+                                    dtype: DTypeLike = np.float64, n_jobs: int = 1) -> Dict[str, Any]:
+    """
+    Compute a correlation matrix together with p-values and confidence intervals.
+
+    Args:
+        data: Input DataFrame
+        method: Correlation method ('pearson', 'spearman', 'kendall')
+        confidence: Confidence level of the intervals
+        adjust: Optional multiple-testing correction (see compute_correlation_pvalues)
+        dtype: Accumulation type of the matrix engines
+        n_jobs: Number of worker processes for Spearman/Kendall
+
+    Returns:
+        Dictionary of DataFrames: 'correlation_matrix', 'p_values', 'ci_lower',
+        'ci_upper' and 'n' (pairwise complete observations)
+    """
+    corr = compute_correlation_matrix(data, method, dtype=dtype, n_jobs=n_jobs)
+    n = compute_pairwise_counts(data)
+    tests = compute_correlation_pvalues(corr.values, n, method, confidence, adjust)
+
+    def frame(values: np.ndarray) -> pd.DataFrame:
+        return pd.DataFrame(values, index=corr.index, columns=corr.columns)
+
+    result = {'correlation_matrix': corr, 'n': frame(n.astype(np.int64))}
+    result.update({key: frame(value) for key, value in tests.items()})
+    return result
+
+
+def _window_sums(values: np.ndarray, window: int,
+                 block_rows: int = WINDOW_BLOCK_ROWS) -> np.ndarray:
+    """
+    Sum of the trailing ``window`` rows at every position (partial at the start).
+
+    Cumulative sums restart every ``max(block_rows, window)`` rows, so the
+    rounding error of the differences depends on the block length rather than
+    on the length of the series.
+    """
+    n = len(values)
+    block = max(block_rows, window)
+    sums = np.empty(values.shape)
+    for start in range(0, n, block):
+        stop = min(start + block, n)
+        lo = max(0, start - window)
+        cumulative = np.cumsum(values[lo:stop], axis=0)
+        sums[start:stop] = cumulative[start - lo:]
+        first = max(start, lo + window)
+        sums[first:stop] -= cumulative[first - window - lo:stop - window - lo]
+    return sums
+
+
+def compute_rolling_moments(x: np.ndarray, y: np.ndarray, window: int,
+                            min_periods: Optional[int] = None) -> Dict[str, np.ndarray]:
+    """
+    Compute rolling covariance and Pearson correlation from sliding sums.
+
+    Sums of x, y, x^2, y^2 and xy are maintained with blockwise cumulative
+    sums, so each series pair costs O(n) whatever the window length. ``y`` may be 2D to
+    correlate one series against many columns at once. Rows where either value
+    is missing are left out of the window, like ``pandas.rolling``.
+
+    Args:
+        x: 1D array of length n
+        y: 1D array of length n or 2D array of shape (n, k)
+        window: Number of trailing observations in each window
+        min_periods: Minimum number of complete pairs (defaults to ``window``)
+
+    Returns:
+        Dictionary with 'covariance' and 'correlation' arrays shaped like ``y``
+        and the per-window 'count'
+    """
+    if window < 1:
+        raise ValueError(f"window must be a positive integer, got {window}")
+    min_periods = window if min_periods is None else min_periods
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    one_dimensional = y.ndim == 1
+    y = y.reshape(len(y), -1)
+    if len(x) != len(y):
+        raise ValueError(f"x and y must have the same length, got {len(x)} and {len(y)}")
+    x = np.broadcast_to(x[:, None], y.shape)
+
+    observed = ~(np.isnan(x) | np.isnan(y))
+    # Shifting by the series means keeps the sliding sums well conditioned
+    xs = np.where(observed, x - np.nanmean(x, axis=0), 0.0)
+    ys = np.where(observed, y - np.nanmean(y, axis=0), 0.0)
+
+    count = _window_sums(observed.astype(np.float64), window)
+    sum_x = _window_sums(xs, window)
+    sum_y = _window_sums(ys, window)
+    sum_xx = _window_sums(xs * xs, window)
+    sum_yy = _window_sums(ys * ys, window)
+    sum_xy = _window_sums(xs * ys, window)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        comoment = sum_xy - sum_x * sum_y / count
+        var_x = np.maximum(sum_xx - sum_x ** 2 / count, 0.0)
+        var_y = np.maximum(sum_yy - sum_y ** 2 / count, 0.0)
+        covariance = comoment / (count - 1)
+        correlation = np.clip(comoment / np.sqrt(var_x * var_y), -1.0, 1.0)
+
+    degenerate = (var_x <= 1e-14 * sum_xx) | (var_y <= 1e-14 * sum_yy)
+    correlation[degenerate] = np.nan
+    too_short = count < max(min_periods, 1)
+    covariance[too_short | (count < 2)] = np.nan
+    correlation[too_short | (count < 2)] = np.nan
+
+    if one_dimensional:
+        covariance, correlation, count = covariance[:, 0], correlation[:, 0], count[:, 0]
+    return {'covariance': covariance, 'correlation': correlation, 'count': count}
+
+
+def compute_rolling_correlation(x: np.ndarray, y: np.ndarray, window: int,
+                                min_periods: Optional[int] = None) -> np.ndarray:
+    """Compute rolling Pearson correlation of ``x`` against one or many series."""
+    return compute_rolling_moments(x, y, window, min_periods)['correlation']
+
+
+def compute_rolling_covariance(x: np.ndarray, y: np.ndarray, window: int,
+                               min_periods: Optional[int] = None) -> np.ndarray:
+    """Compute rolling sample covariance of ``x`` against one or many series."""
+    return compute_rolling_moments(x, y, window, min_periods)['covariance']
+
+
+def compute_cross_correlation(x: np.ndarray, y: np.ndarray, max_lag: Optional[int] = None,
+                              confidence: float = 0.95) -> Dict[str, Any]:
+    """
+    Compute the lagged cross-correlation function (CCF) through the FFT.
+
+    The value at lag ``k`` is ``sum_t (x_t - mean_x) * (y_{t+k} - mean_y) / (n * std_x * std_y)``,
+    so a peak at a positive lag means ``x`` leads ``y``. All lags come from one
+    zero-padded FFT product in O(n log n); ``y`` may be 2D to correlate one
+    series against many columns at once.
+
+    Args:
+        x: 1D array of length n
+        y: 1D array of length n or 2D array of shape (n, k)
+        max_lag: Largest lag in both directions (defaults to n - 1)
+        confidence: Confidence level of the white-noise band
+
+    Returns:
+        Dictionary with 'lags' (from -max_lag to max_lag), 'ccf' shaped
+        (2 * max_lag + 1,) or (2 * max_lag + 1, k), 'confidence_band' (half
+        width of the band around zero) and 'n'
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = x.shape[0]
+    if y.shape[0] != n:
+        raise ValueError(f"x and y must have the same length, got {n} and {y.shape[0]}")
+    max_lag = n - 1 if max_lag is None else int(max_lag)
+    if not 0 <= max_lag < n:
+        raise ValueError(f"max_lag must be between 0 and {n - 1}, got {max_lag}")
+
+    one_dimensional = y.ndim == 1
+    y = y.reshape(n, -1)
+    zx = standardize_columns(x[:, None])[:, 0]
+    zy = standardize_columns(y)
+
+    size = fft.next_fast_len(n + max_lag, real=True)
+    spectrum = np.conj(fft.rfft(zx, size))[:, None] * fft.rfft(zy, size, axis=0)
+    circular = fft.irfft(spectrum, size, axis=0)
+    ccf = np.concatenate([circular[size - max_lag:], circular[:max_lag + 1]])
+
+    if one_dimensional:
+        ccf = ccf[:, 0]
+    return {
+        'lags': np.arange(-max_lag, max_lag + 1),
+        'ccf': ccf,
+        'confidence_band': float(stats.norm.ppf(0.5 + confidence / 2) / np.sqrt(n)),
+        'n': n,
+    }
+
+
+def compute_partial_correlation(cov: np.ndarray, shrinkage: Optional[float] = None) -> np.ndarray:
+    """
+    Compute all partial correlations from one Cholesky inversion of a covariance matrix.
+
+    The partial correlation of i and j given all other variables is
+    ``-P_ij / sqrt(P_ii * P_jj)`` with ``P`` the precision (inverse covariance)
+    matrix, so no per-pair regression is needed. A correlation matrix can be
+    passed instead of a covariance matrix since the result is scale invariant.
+
+    Args:
+        cov: Square covariance (or correlation) matrix
+        shrinkage: Optional intensity in [0, 1] shrinking the off-diagonal
+            entries toward zero, ``(1 - shrinkage) * cov + shrinkage * diag(cov)``,
+            to keep the inversion stable when features approach samples
+
+    Returns:
+        Partial correlation matrix with a unit diagonal
+    """
+    cov = np.array(cov, dtype=np.float64)
+    if shrinkage is not None:
+        if not 0.0 <= shrinkage <= 1.0:
+            raise ValueError(f"shrinkage must be between 0 and 1, got {shrinkage}")
+        cov = (1.0 - shrinkage) * cov + shrinkage * np.diag(np.diagonal(cov))
+
+    try:
+        factor = linalg.cho_factor(cov, lower=True)
+    except linalg.LinAlgError:
+        raise ValueError(
+            "Covariance matrix is not positive definite; use a shrinkage intensity > 0"
+        )
+    precision = linalg.cho_solve(factor, np.eye(cov.shape[0]))
+
+    scale = np.sqrt(np.diagonal(precision))
+    partial = -precision / np.outer(scale, scale)
+    np.clip(partial, -1.0, 1.0, out=partial)
+    np.fill_diagonal(partial, 1.0)
+    return partial
+
+
 def compute_pairwise_correlations(data: pd.DataFrame, method: str = "pearson",
                                   threshold: float = 0.0) -> List[Tuple[str, str, float]]:
     """Compute pairwise correlations above threshold."""
-    corr_matrix = compute_correlation_matrix(data, method)
-    n = len(corr_matrix.columns)
+    if method == "pearson" and _is_numeric_frame(data):
+        values = data.to_numpy(dtype=np.float64)
+        if not np.isnan(values).any():
+            pairs = find_correlated_pairs(values, threshold=threshold)
+        else:
+            pairs = select_pairs(compute_pearson_pairwise_complete(values), threshold=threshold)
+    else:
+        pairs = select_pairs(compute_correlation_matrix(data, method).values, threshold=threshold)
 
-    i, j = np.triu_indices(n, k=1)
-    corr_values = corr_matrix.values[i, j]
+    columns = data.columns
+    return list(zip(columns[pairs['i']], columns[pairs['j']], pairs['r'].tolist()))
 
-    mask = np.abs(corr_values) >= threshold
-    pairs = []
 
-    for idx in np.where(mask)[0]:
-        var1 = corr_matrix.columns[i[idx]]
-        var2 = corr_matrix.columns[j[idx]]
-        corr = corr_values[idx]
-        pairs.append((var1, var2, corr))
+def compute_correlation_test(x: np.ndarray, y: np.ndarray,
+                             method: str = "pearson",
+                             n_permutations: Optional[int] = None,
+                             random_state: Optional[int] = None,
+                             alpha: Optional[float] = None) -> Tuple[float, float]:
+    """
+    Compute correlation coefficient and p-value.
 
-    return sorted(pairs, key=lambda x: abs(x[2]), reverse=True)
+    With ``n_permutations`` the p-value comes from a permutation test instead
+    of the asymptotic distribution (Pearson and Spearman only); ``alpha``
+    lets the permutation test stop early once the p-value is clearly on one
+    side of it.
+    """
+    if n_permutations is not None:
+        from py_stats_toolkit.algorithms.resampling import permutation_correlation_test
 
+        result = permutation_correlation_test(x, y, method, n_permutations=n_permutations,
+                                              alpha=alpha, random_state=random_state)
+        return result['correlation'], result['p_value']
 
-def compute_correlation_test(x: np.ndarray, y: np.ndarray,
-                             method: str = "pearson") -> Tuple[float, float]:
-    """Compute correlation coefficient and p-value."""
     if method == "pearson":
         return stats.pearsonr(x, y)
     elif method == "spearman":
-        return stats.spearmanr(x, y)
+        return compute_spearman_test(x, y)
     elif method == "kendall":
         return stats.kendalltau(x, y)
     else:
@@ -0,0 +1,225 @@
+"""Pure nonlinear dependence algorithms (mutual information, distance correlation)."""
+
+from functools import partial
+from typing import Optional
+
+import numpy as np
+
+from py_stats_toolkit.algorithms.correlation import _sum_smaller_before
+from py_stats_toolkit.utils.parallel import ParallelProcessor
+
+
+def quantile_bin(X: np.ndarray, n_bins: int) -> np.ndarray:
+    """
+    Discretize every column into (at most) ``n_bins`` equal-frequency bins.
+
+    Args:
+        X: 2D array of shape (n_samples, n_features)
+        n_bins: Number of quantile bins per column
+
+    Returns:
+        Integer array of bin codes in ``[0, n_bins)`` with the shape of ``X``
+    """
+    X = np.asarray(X, dtype=np.float64)
+    quantiles = np.quantile(X, np.linspace(0, 1, n_bins + 1)[1:-1], axis=0)
+    codes = np.empty(X.shape, dtype=np.int64)
+    for k in range(X.shape[1]):
+        codes[:, k] = np.searchsorted(np.unique(quantiles[:, k]), X[:, k], side='right')
+    return codes
+
+
+def _mutual_information_row(i: int, codes: np.ndarray, n_bins: int) -> np.ndarray:
+    """Mutual information of column ``i`` against every column from ``i`` on."""
+    n, n_cols = codes.shape
+    row = np.full(n_cols, np.nan)
+    marginal_i = np.bincount(codes[:, i], minlength=n_bins) / n
+    offset = codes[:, i] * n_bins
+
+    for j in range(i, n_cols):
+        joint = np.bincount(offset + codes[:, j], minlength=n_bins * n_bins).reshape(n_bins, n_bins)
+        marginal_j = np.bincount(codes[:, j], minlength=n_bins) / n
+        mask = joint > 0
+        p_joint = joint[mask] / n
+        expected = np.outer(marginal_i, marginal_j)[mask]
+        row[j] = max(float((p_joint * np.log(p_joint / expected)).sum()), 0.0)
+
+    return row
+
+
+def compute_mutual_information_matrix(X: np.ndarray, n_bins: Optional[int] = None,
+                                      normalized: bool = False, n_jobs: int = 1) -> np.ndarray:
+    """
+    Compute pairwise mutual information from shared quantile binning.
+
+    Columns are binned once; each pair then needs a single 2D histogram built
+    with ``np.bincount`` on combined bin codes. Rows of the matrix are spread
+    over a process pool when ``n_jobs != 1``.
+
+    Args:
+        X: 2D array of shape (n_samples, n_features) without missing values
+        n_bins: Quantile bins per column (defaults to n ** (1/3), within [2, 64])
+        normalized: If True, divide by sqrt(H(x) * H(y)) to get values in [0, 1]
+        n_jobs: Number of worker processes (-1 for all cores)
+
+    Returns:
+        Symmetric matrix of mutual information in nats (entropies on the diagonal)
+    """
+    X = np.asarray(X, dtype=np.float64)
+    n, n_cols = X.shape
+    if n_bins is None:
+        n_bins = int(np.clip(round(n ** (1 / 3)), 2, 64))
+    codes = quantile_bin(X, n_bins)
+
+    rows = ParallelProcessor(n_jobs=n_jobs).parallel_map(
+        partial(_mutual_information_row, codes=codes, n_bins=n_bins),
+        list(range(n_cols)), min_items=2
+    )
+    mi = np.vstack(rows)
+    upper = np.triu_indices(n_cols, k=1)
+    mi[upper[1], upper[0]] = mi[upper]
+
+    if normalized:
+        entropy = np.diagonal(mi).copy()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mi = mi / np.sqrt(np.outer(entropy, entropy))
+    return mi
+
+
+def _distance_sums(x: np.ndarray) -> np.ndarray:
+    """Row sums ``sum_j |x_i - x_j|`` of the distance matrix in O(n log n)."""
+    order = np.argsort(x, kind='stable')
+    xs = x[order]
+    n = len(xs)
+    below = np.cumsum(xs) - xs
+    k = np.arange(n)
+    sums = np.empty(n)
+    sums[order] = xs * k - below + (xs.sum() - below - xs) - xs * (n - 1 - k)
+    return sums
+
+
+def _distance_cross_sum(x: np.ndarray, y: np.ndarray) -> float:
+    """Compute ``sum_{i != j} |x_i - x_j| * |y_i - y_j|`` in O(n log n)."""
+    order = np.lexsort((y, x))
+    xs, ys = x[order], y[order]
+    _, y_rank = np.unique(ys, return_inverse=True)
+
+    weights = np.column_stack([np.ones_like(xs), ys, xs, xs * ys])
+    smaller = _sum_smaller_before(y_rank, weights)
+    larger = np.cumsum(weights, axis=0) - weights - smaller
+
+    def signed_terms(acc: np.ndarray) -> np.ndarray:
+        count, sum_y, sum_x, sum_xy = acc.T
+        return xs * ys * count - xs * sum_y - ys * sum_x + sum_xy
+
+    return 2.0 * float((signed_terms(smaller) - signed_terms(larger)).sum())
+
+
+def _distance_covariance_terms(cross: float, a_rows: np.ndarray, b_rows: np.ndarray,
+                               bias_corrected: bool) -> float:
+    """Squared distance covariance from distance row sums and the cross sum."""
+    n = len(a_rows)
+    if bias_corrected:
+        return (cross - 2.0 / (n - 2) * (a_rows @ b_rows)
+                + a_rows.sum() * b_rows.sum() / ((n - 1) * (n - 2))) / (n * (n - 3))
+    return (cross - 2.0 / n * (a_rows @ b_rows) + a_rows.sum() * b_rows.sum() / n ** 2) / n ** 2
+
+
+def _distance_self_covariance(x: np.ndarray, rows: np.ndarray, bias_corrected: bool) -> float:
+    """Squared distance variance of ``x`` given its distance row sums."""
+    cross = 2.0 * (len(x) * (x @ x) - x.sum() ** 2)
+    return _distance_covariance_terms(cross, rows, rows, bias_corrected)
+
+
+def _distance_correlation_from_terms(dcov_xy: float, dcov_xx: float, dcov_yy: float,
+                                     bias_corrected: bool) -> float:
+    """Turn a squared distance covariance and both variances into a correlation."""
+    denominator = np.sqrt(dcov_xx * dcov_yy)
+    if denominator <= 0:
+        return float('nan')
+
+    ratio = dcov_xy / denominator
+    if bias_corrected:
+        return float(ratio)
+    return float(np.sqrt(np.clip(ratio, 0.0, 1.0)))
+
+
+def compute_distance_correlation(x: np.ndarray, y: np.ndarray,
+                                 bias_corrected: bool = False) -> float:
+    """
+    Compute the distance correlation of two samples in O(n log n).
+
+    Uses the sorting-based algorithm of Huo and Szekely (2016): distance row
+    sums come from prefix sums over sorted values and the cross term from a
+    merge-sort style pass, so no n x n distance matrix is ever built.
+
+    Args:
+        x: 1D array
+        y: 1D array of the same length
+        bias_corrected: If True, return the bias-corrected squared distance
+            correlation (U-statistic, may be slightly negative); otherwise the
+            usual distance correlation in [0, 1]
+
+    Returns:
+        Distance correlation
+    """
+    x = np.asarray(x, dtype=np.float64).ravel()
+    y = np.asarray(y, dtype=np.float64).ravel()
+    if len(x) != len(y):
+        raise ValueError(f"x and y must have the same length, got {len(x)} and {len(y)}")
+    if len(x) < (4 if bias_corrected else 2):
+        raise ValueError("Not enough samples to compute a distance correlation")
+    x = x - x.mean()
+    y = y - y.mean()
+
+    a_rows, b_rows = _distance_sums(x), _distance_sums(y)
+    return _distance_correlation_from_terms(
+        _distance_covariance_terms(_distance_cross_sum(x, y), a_rows, b_rows, bias_corrected),
+        _distance_self_covariance(x, a_rows, bias_corrected),
+        _distance_self_covariance(y, b_rows, bias_corrected),
+        bias_corrected
+    )
+
+
+def _distance_correlation_row(i: int, X: np.ndarray, row_sums: np.ndarray,
+                              self_dcov: np.ndarray, bias_corrected: bool) -> np.ndarray:
+    """Distance correlation of column ``i`` against every later column."""
+    row = np.full(X.shape[1], np.nan)
+    for j in range(i + 1, X.shape[1]):
+        dcov = _distance_covariance_terms(_distance_cross_sum(X[:, i], X[:, j]),
+                                          row_sums[:, i], row_sums[:, j], bias_corrected)
+        row[j] = _distance_correlation_from_terms(dcov, self_dcov[i], self_dcov[j], bias_corrected)
+    return row
+
+
+def compute_distance_correlation_matrix(X: np.ndarray, bias_corrected: bool = False,
+                                        n_jobs: int = 1) -> np.ndarray:
+    """
+    Compute pairwise distance correlations, O(n log n) per pair.
+
+    Args:
+        X: 2D array of shape (n_samples, n_features) without missing values
+        bias_corrected: Return bias-corrected squared distance correlations
+        n_jobs: Number of worker processes (-1 for all cores)
+
+    Returns:
+        Symmetric matrix of distance correlations with a unit diagonal
+    """
+    X = np.asarray(X, dtype=np.float64)
+    if len(X) < (4 if bias_corrected else 2):
+        raise ValueError("Not enough samples to compute a distance correlation")
+    n_cols = X.shape[1]
+    # Per-column terms are shared by every pair involving the column
+    X = X - X.mean(axis=0)
+    row_sums = np.column_stack([_distance_sums(X[:, j]) for j in range(n_cols)])
+    self_dcov = np.array([_distance_self_covariance(X[:, j], row_sums[:, j], bias_corrected)
+                          for j in range(n_cols)])
+    rows = ParallelProcessor(n_jobs=n_jobs).parallel_map(
+        partial(_distance_correlation_row, X=X, row_sums=row_sums, self_dcov=self_dcov,
+                bias_corrected=bias_corrected),
+        list(range(n_cols)), min_items=2
+    )
+    dcor = np.vstack(rows)
+    upper = np.triu_indices(n_cols, k=1)
+    dcor[upper[1], upper[0]] = dcor[upper]
+    np.fill_diagonal(dcor, 1.0)
+    return dcor
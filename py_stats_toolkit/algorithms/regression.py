@@ -1,31 +1,309 @@
 """Pure regression algorithms."""
 
-from typing import Any, Dict
+from collections.abc import MutableMapping
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple, Union
 
 import numpy as np
-from scipy import stats
-from sklearn.linear_model import Lasso, LinearRegression, Ridge
+import pandas as pd
+from numpy.typing import ArrayLike
+from scipy import linalg, stats
+from sklearn.linear_model import Lasso, LinearRegression, Ridge, enet_path
 from sklearn.preprocessing import PolynomialFeatures
 
+from py_stats_toolkit.algorithms.correlation import CorrelationAccumulator
+from py_stats_toolkit.utils.parallel import ParallelProcessor
 
-def compute_linear_regression(X: np.ndarray, y: np.ndarray) -> Dict[str, Any]:
-    """Compute linear regression."""
-    model = LinearRegression()
-    model.fit(X, y)
+DEFAULT_CHUNK_ROWS = 100_000
+
+
+class OLSModel:
+    """
+    Lightweight fitted linear model produced by the native solvers.
+
+    Exposes ``coef_``, ``intercept_`` and ``predict`` like scikit-learn models,
+    and keeps the upper-triangular factor ``R`` of the centered Gram matrix
+    (``Xc.T @ Xc = R.T @ R``) so later computations can reuse it.
+    """
+
+    def __init__(self, coef: np.ndarray, intercept: Union[float, np.ndarray],
+                 x_mean: np.ndarray, n_samples: int,
+                 r_factor: Optional[np.ndarray] = None) -> None:
+        """
+        Initialize the fitted model.
+
+        Args:
+            coef: Coefficients, shape (n_features,) or (n_targets, n_features)
+            intercept: Intercept, scalar or shape (n_targets,)
+            x_mean: Feature means of the training data
+            n_samples: Number of training rows
+            r_factor: Upper-triangular factor of the centered Gram matrix
+                (None when the Gram matrix is singular)
+        """
+        self.coef_ = coef
+        self.intercept_ = intercept
+        self.x_mean = x_mean
+        self.n_samples = n_samples
+        self.r_factor = r_factor
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """Predict targets for the rows of ``X``."""
+        return np.asarray(X) @ self.coef_.T + self.intercept_
+
+
+def _solve_gram(xx: np.ndarray, xy: np.ndarray) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """Solve ``xx @ coef = xy`` by Cholesky, falling back to least squares if singular."""
+    try:
+        r_factor = linalg.cholesky(xx, lower=False)
+    except linalg.LinAlgError:
+        return linalg.lstsq(xx, xy)[0], None
+    pivots = np.abs(np.diagonal(r_factor))
+    if pivots.min(initial=np.inf) <= np.sqrt(np.finfo(np.float64).eps) * pivots.max(initial=0.0):
+        return linalg.lstsq(xx, xy)[0], None
+    z = linalg.solve_triangular(r_factor, xy, trans='T')
+    return linalg.solve_triangular(r_factor, z), r_factor
+
+
+def accumulate_regression_moments(X: np.ndarray, y: np.ndarray,
+                                  chunk_rows: int = DEFAULT_CHUNK_ROWS) -> CorrelationAccumulator:
+    """
+    Gather the co-moments of ``[X, y]`` in a single pass over row chunks.
+
+    Args:
+        X: 2D feature array of shape (n_samples, n_features)
+        y: Target of shape (n_samples,) or (n_samples, n_targets)
+        chunk_rows: Rows stacked per update
+
+    Returns:
+        Accumulator holding the count, means and centered cross-products
+    """
+    accumulator = CorrelationAccumulator()
+    y = np.asarray(y).reshape(len(y), -1)
+    for start in range(0, len(X), chunk_rows):
+        stop = start + chunk_rows
+        accumulator.update(np.hstack([np.asarray(X[start:stop]), y[start:stop]]))
+    return accumulator
+
+
+def solve_from_moments(accumulator: CorrelationAccumulator, n_features: int) -> OLSModel:
+    """
+    Solve ordinary least squares from accumulated co-moments.
+
+    Args:
+        accumulator: Co-moments of ``[X, y]`` (features first)
+        n_features: Number of feature columns in the accumulator
+
+    Returns:
+        Fitted OLSModel (1D coefficients for a single target)
+    """
+    if accumulator.count == 0:
+        raise ValueError("No rows have been accumulated")
+    p = n_features
+    xx = accumulator.comoment[:p, :p]
+    xy = accumulator.comoment[:p, p:]
+    coef, r_factor = _solve_gram(xx, xy)
+
+    x_mean, y_mean = accumulator.mean[:p].copy(), accumulator.mean[p:]
+    intercept = y_mean - x_mean @ coef
+    if coef.shape[1] == 1:
+        return OLSModel(coef[:, 0], float(intercept[0]), x_mean, accumulator.count, r_factor)
+    return OLSModel(coef.T, intercept, x_mean, accumulator.count, r_factor)
+
+
+class OLSAccumulator:
+    """
+    Streaming sufficient statistics for ordinary least squares.
 
+    Holds the row count, the means and the centered cross-products of
+    ``[X, y]`` (the numerically stable form of X^T X, X^T y and y^T y), so a
+    fit over chunked data needs O(p^2) memory. Accumulators filled by
+    different workers can be merged before solving.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty accumulator."""
+        self.moments = CorrelationAccumulator()
+        self.n_features = None
+
+    @property
+    def count(self) -> int:
+        """Number of rows accumulated so far."""
+        return self.moments.count
+
+    def partial_fit(self, X: np.ndarray, y: np.ndarray) -> "OLSAccumulator":
+        """
+        Add a chunk of rows.
+
+        Args:
+            X: 2D feature chunk of shape (n_rows, n_features)
+            y: Target chunk of shape (n_rows,)
+
+        Returns:
+            Self for method chaining
+        """
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim != 2:
+            raise ValueError(f"X must be 2D, got shape {X.shape}")
+        if self.n_features is None:
+            self.n_features = X.shape[1]
+        elif X.shape[1] != self.n_features:
+            raise ValueError(f"Expected {self.n_features} features, got {X.shape[1]}")
+        self.moments.update(np.column_stack([X, np.asarray(y, dtype=np.float64).ravel()]))
+        return self
+
+    def merge(self, other: "OLSAccumulator") -> "OLSAccumulator":
+        """
+        Merge an accumulator built on disjoint rows.
+
+        Args:
+            other: Accumulator to merge into this one
+
+        Returns:
+            Self for method chaining
+        """
+        if other.n_features is not None:
+            if self.n_features is None:
+                self.n_features = other.n_features
+            elif other.n_features != self.n_features:
+                raise ValueError(f"Expected {self.n_features} features, got {other.n_features}")
+        self.moments.merge(other.moments)
+        return self
+
+    def finalize(self) -> Dict[str, Any]:
+        """
+        Solve the accumulated normal equations.
+
+        Returns:
+            Dictionary with coefficients, intercept, r2_score, n_samples and
+            model (predictions and residuals are not kept for streamed data)
+        """
+        if self.n_features is None:
+            raise ValueError("No rows have been accumulated. Call partial_fit() first.")
+        model = solve_from_moments(self.moments, self.n_features)
+        p = self.n_features
+        total = self.moments.comoment[p, p]
+        explained = model.coef_ @ self.moments.comoment[:p, p]
+
+        return {
+            'coefficients': model.coef_,
+            'intercept': model.intercept_,
+            'r2_score': explained / total if total > 0 else 0.0,
+            'n_samples': self.count,
+            'model': model
+        }
+
+
+def _fit_ols_qr(X: np.ndarray, y: np.ndarray) -> OLSModel:
+    """Fit ordinary least squares through an economic QR of the centered design."""
+    x_mean = X.mean(axis=0)
+    y_mean = y.mean(axis=0)
+    q, r = linalg.qr(X - x_mean, mode='economic')
+    pivots = np.abs(np.diagonal(r))
+    if pivots.min(initial=np.inf) > np.finfo(np.float64).eps * len(X) * pivots.max(initial=0.0):
+        coef = linalg.solve_triangular(r, q.T @ (y - y_mean))
+    else:
+        coef = linalg.lstsq(X - x_mean, y - y_mean)[0]
+        r = None
+    return OLSModel(coef, float(y_mean - x_mean @ coef), x_mean, X.shape[0], r)
+
+
+def _regression_result(model: Any, X: np.ndarray, y: np.ndarray) -> Dict[str, Any]:
+    """
+    Build the standard result dictionary from a single prediction pass.
+
+    For a 2D ``y`` the R² is averaged over the target columns, as in ``model.score``.
+    """
     y_pred = model.predict(X)
     residuals = y - y_pred
+    centered = y - y.mean(axis=0)
+    rss = np.einsum('i...,i...->...', residuals, residuals)
+    total = np.einsum('i...,i...->...', centered, centered)
+    r2 = np.where(total > 0, 1.0 - rss / np.where(total > 0, total, 1.0), 0.0)
 
     return {
         'coefficients': model.coef_,
         'intercept': model.intercept_,
-        'r2_score': model.score(X, y),
+        'r2_score': float(np.mean(r2)),
         'predictions': y_pred,
         'residuals': residuals,
         'model': model
     }
 
 
+def compute_linear_regression(X: np.ndarray, y: np.ndarray, solver: str = "sklearn",
+                              chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Dict[str, Any]:
+    """
+    Compute linear regression.
+
+    Args:
+        X: Feature matrix
+        y: Target vector
+        solver: 'sklearn', 'cholesky' (normal equations accumulated in one
+            pass over row chunks) or 'qr' (factorization of the centered design)
+        chunk_rows: Rows per chunk for the 'cholesky' solver
+
+    Returns:
+        Dictionary with coefficients, intercept, r2_score, predictions,
+        residuals and model
+    """
+    if solver == "cholesky":
+        accumulator = accumulate_regression_moments(X, y, chunk_rows)
+        return _regression_result(solve_from_moments(accumulator, X.shape[1]), X, y)
+    if solver == "qr":
+        return _regression_result(_fit_ols_qr(np.asarray(X, dtype=np.float64), y), X, y)
+    if solver != "sklearn":
+        raise ValueError(f"Unknown solver: {solver}. Supported: 'sklearn', 'cholesky', 'qr'")
+
+    model = LinearRegression()
+    model.fit(X, y)
+
+    return _regression_result(model, X, y)
+
+
+def compute_multi_target_regression(X: np.ndarray, Y: np.ndarray) -> Dict[str, Any]:
+    """
+    Fit ordinary least squares of every column of ``Y`` on the same ``X``.
+
+    The centered Gram matrix is factorized once and all targets are solved
+    together from ``X^T Y`` with one pair of triangular solves.
+
+    Args:
+        X: Feature matrix of shape (n_samples, n_features)
+        Y: Target matrix of shape (n_samples, n_targets)
+
+    Returns:
+        Dictionary with coefficients (n_targets, n_features), intercept and
+        r2_score arrays (n_targets,), n_samples and model
+    """
+    X = np.asarray(X, dtype=np.float64)
+    Y = np.asarray(Y, dtype=np.float64)
+    if Y.ndim == 1:
+        Y = Y[:, None]
+    if X.ndim != 2 or len(X) != len(Y):
+        raise ValueError(f"Incompatible shapes: X {X.shape}, Y {Y.shape}")
+
+    x_mean = X.mean(axis=0)
+    y_mean = Y.mean(axis=0)
+    centered = X - x_mean
+    y_centered = Y - y_mean
+    xy = centered.T @ y_centered
+    coef, r_factor = _solve_gram(centered.T @ centered, xy)
+
+    total = np.einsum('ij,ij->j', y_centered, y_centered)
+    explained = np.einsum('ij,ij->j', coef, xy)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        r2 = np.where(total > 0, explained / total, 0.0)
+
+    model = OLSModel(coef.T, y_mean - x_mean @ coef, x_mean, len(X), r_factor)
+    return {
+        'coefficients': model.coef_,
+        'intercept': model.intercept_,
+        'r2_score': r2,
+        'n_samples': len(X),
+        'model': model
+    }
+
+
 def compute_ridge_regression(X: np.ndarray, y: np.ndarray, alpha: float = 1.0) -> Dict[str, Any]:
     """Compute Ridge regression."""
     model = Ridge(alpha=alpha)
@@ -45,6 +323,72 @@ def compute_ridge_regression(X: np.ndarray, y: np.ndarray, alpha: float = 1.0) -
     }
 
 
+def compute_ridge_path(X: np.ndarray, y: np.ndarray, alphas: ArrayLike) -> Dict[str, Any]:
+    """
+    Fit ridge regression for a whole vector of penalties from one SVD.
+
+    With ``Xc = U S V^T`` (centered features) every alpha only rescales the
+    singular values, so coefficients, leave-one-out and GCV errors for all
+    alphas come from a few matrix products. The intercept is unpenalized,
+    matching ``sklearn.linear_model.Ridge``.
+
+    Args:
+        X: Feature matrix of shape (n_samples, n_features)
+        y: Target vector of shape (n_samples,)
+        alphas: Non-negative penalties
+
+    Returns:
+        Dictionary with alphas, coefficient_path (n_alphas, n_features),
+        intercept_path, loo_mse, gcv, best_alpha (lowest leave-one-out error)
+        and, for that alpha, coefficients, intercept, r2_score, predictions,
+        residuals and model
+    """
+    X = np.asarray(X, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    alphas = np.atleast_1d(np.asarray(alphas, dtype=np.float64))
+    if np.any(alphas < 0):
+        raise ValueError("alphas must be non-negative")
+    n = len(X)
+
+    x_mean, y_mean = X.mean(axis=0), y.mean()
+    u, s, vt = linalg.svd(X - x_mean, full_matrices=False)
+    yc = y - y_mean
+    uty = u.T @ yc
+
+    s2 = s[:, None] ** 2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        shrink = np.where(s2 > 0, s2 / (s2 + alphas), 0.0)
+        coef_scale = np.where(s2 > 0, s[:, None] / (s2 + alphas), 0.0)
+
+    coef_path = (vt.T @ (coef_scale * uty[:, None])).T
+    intercept_path = y_mean - coef_path @ x_mean
+    residuals = yc[:, None] - u @ (shrink * uty[:, None])
+    leverage = 1.0 / n + (u ** 2) @ shrink
+    with np.errstate(divide='ignore', invalid='ignore'):
+        loo_mse = np.mean((residuals / (1.0 - leverage)) ** 2, axis=0)
+        gcv = np.mean(residuals ** 2, axis=0) / (1.0 - (1.0 + shrink.sum(axis=0)) / n) ** 2
+
+    best = int(np.nanargmin(loo_mse))
+    total = yc @ yc
+    model = OLSModel(coef_path[best], float(intercept_path[best]), x_mean, n)
+
+    return {
+        'alphas': alphas,
+        'coefficient_path': coef_path,
+        'intercept_path': intercept_path,
+        'loo_mse': loo_mse,
+        'gcv': gcv,
+        'best_alpha': float(alphas[best]),
+        'alpha': float(alphas[best]),
+        'coefficients': model.coef_,
+        'intercept': model.intercept_,
+        'r2_score': 1.0 - (residuals[:, best] @ residuals[:, best]) / total if total > 0 else 0.0,
+        'predictions': y - residuals[:, best],
+        'residuals': residuals[:, best],
+        'model': model
+    }
+
+
 def compute_lasso_regression(X: np.ndarray, y: np.ndarray, alpha: float = 1.0) -> Dict[str, Any]:
     """Compute Lasso regression."""
     model = Lasso(alpha=alpha)
@@ -64,8 +408,206 @@ def compute_lasso_regression(X: np.ndarray, y: np.ndarray, alpha: float = 1.0) -
     }
 
 
-def compute_polynomial_regression(X: np.ndarray, y: np.ndarray, degree: int = 2) -> Dict[str, Any]:
-    """Compute polynomial regression."""
+LASSO_CRITERIA = ('bic', 'aic', 'min_alpha')
+
+
+def compute_lasso_path(X: np.ndarray, y: np.ndarray, alphas: Optional[ArrayLike] = None,
+                       n_alphas: int = 100, eps: float = 1e-3, l1_ratio: float = 1.0,
+                       precompute: Union[bool, str] = "auto",
+                       tol: float = 1e-4, max_iter: int = 1000,
+                       criterion: str = "bic") -> Dict[str, Any]:
+    """
+    Fit a lasso / elastic-net regularization path.
+
+    Alphas are visited from largest to smallest and each fit is warm-started
+    from the previous one. Before each fit the sequential strong rule discards
+    features unlikely to enter the model; discarded features are checked
+    against the KKT conditions afterwards and refitted if they violate them.
+    When ``n_samples > n_features`` the Gram matrix is computed once and
+    reused for every fit and every gradient.
+
+    Args:
+        X: Feature matrix of shape (n_samples, n_features)
+        y: Target vector of shape (n_samples,)
+        alphas: Penalties (sorted in decreasing order); defaults to a log grid
+            of ``n_alphas`` values from the smallest all-zero penalty down to
+            ``eps`` times it
+        n_alphas: Grid size when alphas is None
+        eps: Ratio of the smallest to the largest alpha of the default grid
+        l1_ratio: Elastic-net mixing (1.0 is the lasso)
+        precompute: Use the Gram matrix (True/False/'auto')
+        tol: Coordinate descent tolerance
+        max_iter: Coordinate descent iteration cap per alpha
+        criterion: How the reported model is chosen along the path: 'bic' or
+            'aic' (``n * log(RSS / n) + penalty * n_active``, with the number
+            of nonzero coefficients as degrees of freedom) or 'min_alpha'
+            (the last, least penalized fit)
+
+    Returns:
+        Dictionary with alphas, coefficient_path (n_alphas, n_features),
+        intercept_path, rss, n_active, n_screened and criterion_values per
+        alpha, best_index, and for the selected alpha coefficients, intercept,
+        r2_score, predictions, residuals and model
+    """
+    X = np.asarray(X, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if not 0 < l1_ratio <= 1:
+        raise ValueError("l1_ratio must be in (0, 1]")
+    if criterion not in LASSO_CRITERIA:
+        raise ValueError(f"Unknown criterion: {criterion}. Supported: {', '.join(LASSO_CRITERIA)}")
+    n, p = X.shape
+
+    x_mean, y_mean = X.mean(axis=0), y.mean()
+    centered = np.asfortranarray(X - x_mean)
+    yc = y - y_mean
+    xy = centered.T @ yc
+    alpha_max = np.abs(xy).max(initial=0.0) / (n * l1_ratio)
+
+    if alphas is None:
+        alphas = alpha_max * np.logspace(0, np.log10(eps), n_alphas)
+    else:
+        alphas = np.sort(np.atleast_1d(np.asarray(alphas, dtype=np.float64)))[::-1]
+    if precompute == "auto":
+        precompute = n > p
+    gram = centered.T @ centered if precompute else None
+
+    coef_path = np.zeros((len(alphas), p))
+    rss = np.zeros(len(alphas))
+    n_screened = np.zeros(len(alphas), dtype=np.int64)
+    coef = np.zeros(p)
+    gradient = xy.copy()
+    previous = alpha_max
+    scale = n * l1_ratio
+
+    for k, alpha in enumerate(alphas):
+        keep = (coef != 0) | (np.abs(gradient) >= scale * (2 * alpha - previous))
+        while True:
+            active = np.flatnonzero(keep)
+            fitted = np.zeros(p)
+            if active.size:
+                sub_gram = gram[np.ix_(active, active)] if gram is not None else False
+                fitted[active] = enet_path(
+                    centered[:, active], yc, l1_ratio=l1_ratio, alphas=[alpha],
+                    precompute=sub_gram, Xy=xy[active] if gram is not None else None,
+                    coef_init=coef[active], tol=tol, max_iter=max_iter
+                )[1][:, 0]
+            support = np.flatnonzero(fitted)
+            if gram is not None:
+                gradient = xy - gram[:, support] @ fitted[support]
+                # |yc - Xc b|^2 = yc.yc - b.(X^T y) - b.(X^T r) with r the residual
+                rss[k] = max(yc @ yc - fitted @ (xy + gradient), 0.0)
+            else:
+                residual = yc - centered[:, support] @ fitted[support]
+                gradient = centered.T @ residual
+                rss[k] = residual @ residual
+            violators = ~keep & (np.abs(gradient) > scale * alpha)
+            if not violators.any():
+                break
+            keep |= violators
+        coef = fitted
+        coef_path[k] = coef
+        n_screened[k] = active.size
+        previous = alpha
+
+    intercept_path = y_mean - coef_path @ x_mean
+    n_active = np.count_nonzero(coef_path, axis=1)
+    if criterion == "min_alpha":
+        criterion_values = alphas.copy()
+    else:
+        penalty = np.log(n) if criterion == "bic" else 2.0
+        tiny = np.finfo(np.float64).tiny
+        criterion_values = n * np.log(np.maximum(rss, tiny) / n) + penalty * n_active
+    best = int(np.argmin(criterion_values))
+
+    model = OLSModel(coef_path[best], float(intercept_path[best]), x_mean, n)
+    return dict(_regression_result(model, X, y), **{
+        'alphas': alphas,
+        'alpha': float(alphas[best]),
+        'best_index': best,
+        'criterion': criterion,
+        'criterion_values': criterion_values,
+        'coefficient_path': coef_path,
+        'intercept_path': intercept_path,
+        'rss': rss,
+        'n_active': n_active,
+        'n_screened': n_screened
+    })
+
+
+def polynomial_chunk_rows(transformer: PolynomialFeatures, memory: int = 1 << 26) -> int:
+    """Rows per chunk so that one expanded chunk stays within ``memory`` bytes."""
+    return max(1, memory // (8 * transformer.n_output_features_))
+
+
+def predict_polynomial(model: Any, transformer: PolynomialFeatures, X: np.ndarray,
+                       chunk_rows: Optional[int] = None) -> np.ndarray:
+    """
+    Predict from a polynomial model, expanding the features one chunk at a time.
+
+    Args:
+        model: Fitted linear model on the expanded features
+        transformer: Fitted PolynomialFeatures
+        X: Raw feature matrix
+        chunk_rows: Rows expanded at once (derived from the expansion width by default)
+
+    Returns:
+        Predictions
+    """
+    X = np.asarray(X)
+    if chunk_rows is None:
+        chunk_rows = polynomial_chunk_rows(transformer)
+    return np.concatenate([
+        model.predict(transformer.transform(X[start:start + chunk_rows]))
+        for start in range(0, len(X), chunk_rows)
+    ]) if len(X) else np.empty(0)
+
+
+def compute_polynomial_regression(X: np.ndarray, y: np.ndarray, degree: int = 2,
+                                  chunk_rows: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Compute polynomial regression.
+
+    With ``chunk_rows`` the expanded design is never materialized: the Gram
+    matrix of the polynomial terms is accumulated chunk by chunk and solved
+    by Cholesky, and predictions are evaluated chunk by chunk.
+
+    Args:
+        X: Feature matrix
+        y: Target vector
+        degree: Polynomial degree
+        chunk_rows: Rows expanded at once (None expands the full design)
+
+    Returns:
+        Dictionary with coefficients, intercept, r2_score, degree, predictions,
+        residuals, model and transformer
+    """
+    if chunk_rows is not None:
+        y = np.asarray(y, dtype=np.float64)
+        poly = PolynomialFeatures(degree=degree).fit(X[:1])
+        moments = CorrelationAccumulator()
+        for start in range(0, len(X), chunk_rows):
+            stop = start + chunk_rows
+            moments.update(np.column_stack([poly.transform(X[start:stop])[:, 1:], y[start:stop]]))
+
+        p = poly.n_output_features_ - 1
+        fitted = solve_from_moments(moments, p)
+        # Keep the bias column of the expansion so the model predicts from transform()
+        model = OLSModel(np.concatenate([[0.0], fitted.coef_]), fitted.intercept_,
+                         np.concatenate([[1.0], fitted.x_mean]), fitted.n_samples, fitted.r_factor)
+        total = moments.comoment[p, p]
+
+        y_pred = predict_polynomial(model, poly, X, chunk_rows)
+        return {
+            'coefficients': model.coef_,
+            'intercept': model.intercept_,
+            'r2_score': fitted.coef_ @ moments.comoment[:p, p] / total if total > 0 else 0.0,
+            'degree': degree,
+            'predictions': y_pred,
+            'residuals': y - y_pred,
+            'model': model,
+            'transformer': poly
+        }
+
     poly = PolynomialFeatures(degree=degree)
     X_poly = poly.fit_transform(X)
 
@@ -87,6 +629,385 @@ def compute_polynomial_regression(X: np.ndarray, y: np.ndarray, degree: int = 2)
     }
 
 
+def _factorize_groups(groups: ArrayLike) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Return group codes, sorted labels, row order by group and group sizes."""
+    codes, labels = pd.factorize(np.asarray(groups), sort=True)
+    if np.any(codes < 0):
+        raise ValueError("groups must not contain missing values")
+    order = np.argsort(codes, kind='stable')
+    return codes, np.asarray(labels), order, np.bincount(codes, minlength=len(labels))
+
+
+def _fit_group_batch(task: Tuple[np.ndarray, np.ndarray, np.ndarray],
+                     fit: Callable) -> List[Dict[str, Any]]:
+    """Fit ``fit`` on each group of a contiguous block of sorted rows."""
+    X, y, counts = task
+    bounds = np.cumsum(counts)[:-1]
+    return [fit(X_group, y_group)
+            for X_group, y_group in zip(np.split(X, bounds), np.split(y, bounds))]
+
+
+def _grouped_ols(X: np.ndarray, y: np.ndarray, starts: np.ndarray,
+                 counts: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Solve OLS for every group of group-sorted rows in one batch."""
+    n_groups, p = len(counts), X.shape[1]
+    x_mean = np.add.reduceat(X, starts, axis=0) / counts[:, None]
+    y_mean = np.add.reduceat(y, starts) / counts
+    xc = X - np.repeat(x_mean, counts, axis=0)
+    yc = y - np.repeat(y_mean, counts)
+
+    sxx = np.empty((n_groups, p, p))
+    for i in range(p):
+        block = np.add.reduceat(xc[:, i:i + 1] * xc[:, i:], starts, axis=0)
+        sxx[:, i, i:] = block
+        sxx[:, i:, i] = block
+    sxy = np.add.reduceat(xc * yc[:, None], starts, axis=0)
+    syy = np.add.reduceat(yc * yc, starts)
+
+    try:
+        coef = np.linalg.solve(sxx, sxy[..., None])[..., 0]
+    except np.linalg.LinAlgError:
+        coef = (np.linalg.pinv(sxx) @ sxy[..., None])[..., 0]
+
+    explained = np.einsum('ij,ij->i', coef, sxy)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        r2 = np.where(syy > 0, explained / syy, 0.0)
+    return coef, y_mean - np.einsum('ij,ij->i', x_mean, coef), r2
+
+
+def compute_grouped_regression(X: np.ndarray, y: np.ndarray, groups: ArrayLike,
+                               regression_type: str = "linear", n_jobs: int = 1,
+                               **params: Any) -> Dict[str, Any]:
+    """
+    Fit one regression per group.
+
+    Groups are factorized once and the rows sorted by group. Linear models are
+    solved in one batch from per-group co-moments gathered with
+    ``np.add.reduceat``; other model types are fitted per group across
+    ParallelProcessor workers.
+
+    Args:
+        X: Feature matrix of shape (n_samples, n_features)
+        y: Target vector of shape (n_samples,)
+        groups: Group label of each row
+        regression_type: 'linear', 'ridge', 'lasso' or 'polynomial'
+        n_jobs: Workers for the non-linear model types
+        **params: alpha for ridge/lasso, degree for polynomial
+
+    Returns:
+        Dictionary with groups (sorted labels), coefficients (n_groups, n_coef),
+        intercept, r2_score and n_samples per group, and predictions and
+        residuals in the original row order (plus per-group models for
+        non-linear types)
+    """
+    X = np.asarray(X, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    groups = np.asarray(groups)
+    if len(groups) != len(X):
+        raise ValueError(f"groups has {len(groups)} entries, expected {len(X)}")
+    codes, labels, order, counts = _factorize_groups(groups)
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    X_sorted, y_sorted = X[order], y[order]
+
+    if regression_type == "linear":
+        coef, intercept, r2 = _grouped_ols(X_sorted, y_sorted, starts, counts)
+        predictions = np.einsum('ij,ij->i', X, coef[codes]) + intercept[codes]
+        return {
+            'groups': labels,
+            'coefficients': coef,
+            'intercept': intercept,
+            'r2_score': r2,
+            'n_samples': counts,
+            'predictions': predictions,
+            'residuals': y - predictions
+        }
+
+    fitters = {
+        'ridge': partial(compute_ridge_regression, alpha=params.get('alpha', 1.0)),
+        'lasso': partial(compute_lasso_regression, alpha=params.get('alpha', 1.0)),
+        'polynomial': partial(compute_polynomial_regression, degree=params.get('degree', 2))
+    }
+    if regression_type not in fitters:
+        raise ValueError(f"Unsupported regression type: {regression_type}")
+
+    processor = ParallelProcessor(n_jobs=n_jobs)
+    batches = np.array_split(np.arange(len(labels)), min(len(labels), 4 * processor.n_jobs))
+    tasks = []
+    for batch in batches:
+        lo, hi = starts[batch[0]], starts[batch[-1]] + counts[batch[-1]]
+        tasks.append((X_sorted[lo:hi], y_sorted[lo:hi], counts[batch]))
+    fits = [fit for chunk in processor.parallel_map(partial(_fit_group_batch, fit=fitters[regression_type]),
+                                                    tasks, min_items=2)
+            for fit in chunk]
+
+    predictions = np.empty_like(y)
+    predictions[order] = np.concatenate([fit['predictions'] for fit in fits])
+    result = {
+        'groups': labels,
+        'coefficients': np.array([fit['coefficients'] for fit in fits]),
+        'intercept': np.array([fit['intercept'] for fit in fits]),
+        'r2_score': np.array([fit['r2_score'] for fit in fits]),
+        'n_samples': counts,
+        'predictions': predictions,
+        'residuals': y - predictions,
+        'models': [fit['model'] for fit in fits]
+    }
+    if regression_type == 'polynomial':
+        result['transformer'] = fits[0]['transformer']
+    return result
+
+
+def predict_grouped(result: Mapping[str, Any], X: np.ndarray, groups: ArrayLike) -> np.ndarray:
+    """
+    Predict with the per-group models of compute_grouped_regression.
+
+    Args:
+        result: Result of compute_grouped_regression
+        X: Feature matrix
+        groups: Group label of each row (must be groups seen in training)
+
+    Returns:
+        Predictions
+    """
+    X = np.asarray(X, dtype=np.float64)
+    index = pd.Index(result['groups']).get_indexer(np.asarray(groups))
+    if np.any(index < 0):
+        raise ValueError("groups contains labels that were not fitted")
+
+    if 'models' not in result:
+        coef = np.asarray(result['coefficients'])
+        return np.einsum('ij,ij->i', X, coef[index]) + np.asarray(result['intercept'])[index]
+
+    if 'transformer' in result:
+        X = result['transformer'].transform(X)
+    order = np.argsort(index, kind='stable')
+    codes, starts = np.unique(index[order], return_index=True)
+    predictions = np.empty(len(X))
+    for code, rows in zip(codes, np.split(order, starts[1:])):
+        predictions[rows] = result['models'][code].predict(X[rows])
+    return predictions
+
+
+class LazyRegressionResult(MutableMapping):
+    """
+    Regression result that stores coefficients and summary statistics only.
+
+    ``predictions`` and ``residuals`` are recomputed chunk by chunk on access
+    from a retained reference to the training data. After release_data() (or
+    when built without data) they are no longer available.
+    """
+
+    LAZY_KEYS = ('predictions', 'residuals')
+
+    def __init__(self, values: Dict[str, Any],
+                 predict_rows: Optional[Callable[[int, int], np.ndarray]] = None,
+                 y: Optional[np.ndarray] = None, chunk_rows: int = DEFAULT_CHUNK_ROWS):
+        """
+        Initialize the result.
+
+        Args:
+            values: Eagerly stored entries
+            predict_rows: Callable returning predictions for training rows
+                ``start:stop`` (None if the data is not retained)
+            y: Training target (None if the data is not retained)
+            chunk_rows: Rows predicted per chunk
+        """
+        self._values = {key: value for key, value in values.items() if key not in self.LAZY_KEYS}
+        self._predict_rows = predict_rows
+        self._y = y
+        self.chunk_rows = chunk_rows
+
+    @property
+    def has_data(self) -> bool:
+        """Whether predictions and residuals can still be computed."""
+        return self._predict_rows is not None
+
+    def release_data(self) -> None:
+        """Drop the reference to the training data."""
+        self._predict_rows = None
+        self._y = None
+
+    def iter_predictions(self) -> Iterator[np.ndarray]:
+        """Yield the predictions for consecutive chunks of training rows."""
+        if not self.has_data:
+            raise KeyError("predictions: the training data has been released")
+        for start in range(0, len(self._y), self.chunk_rows):
+            yield self._predict_rows(start, min(start + self.chunk_rows, len(self._y)))
+
+    def iter_residuals(self) -> Iterator[np.ndarray]:
+        """Yield the residuals for consecutive chunks of training rows."""
+        start = 0
+        for chunk in self.iter_predictions():
+            yield self._y[start:start + len(chunk)] - chunk
+            start += len(chunk)
+
+    def __getitem__(self, key: str) -> Any:
+        if key == 'predictions':
+            return np.concatenate(list(self.iter_predictions()))
+        if key == 'residuals':
+            return np.concatenate(list(self.iter_residuals()))
+        return self._values[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in self.LAZY_KEYS:
+            raise KeyError(f"{key} is computed on access and cannot be assigned")
+        self._values[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self._values[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._values or (key in self.LAZY_KEYS and self.has_data)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._values
+        if self.has_data:
+            yield from self.LAZY_KEYS
+
+    def __len__(self) -> int:
+        return len(self._values) + (len(self.LAZY_KEYS) if self.has_data else 0)
+
+
+def make_lean_result(result: Dict[str, Any], X: np.ndarray, y: np.ndarray,
+                     groups: Optional[np.ndarray] = None,
+                     keep_data: bool = True,
+                     chunk_rows: int = DEFAULT_CHUNK_ROWS) -> LazyRegressionResult:
+    """
+    Convert a regression result into a LazyRegressionResult.
+
+    Args:
+        result: Result of one of the compute_* regression functions
+        X: Training features
+        y: Training target
+        groups: Training group labels (results of compute_grouped_regression)
+        keep_data: Keep references to X and y for lazy predictions
+        chunk_rows: Rows predicted per chunk
+
+    Returns:
+        Lean result without predictions and residuals arrays
+    """
+    if not keep_data:
+        return LazyRegressionResult(result, chunk_rows=chunk_rows)
+
+    if 'groups' in result:
+        def predict_rows(start: int, stop: int) -> np.ndarray:
+            return predict_grouped(lean, X[start:stop], groups[start:stop])
+    elif 'transformer' in result:
+        def predict_rows(start: int, stop: int) -> np.ndarray:
+            return predict_polynomial(lean['model'], lean['transformer'], X[start:stop])
+    else:
+        def predict_rows(start: int, stop: int) -> np.ndarray:
+            return lean['model'].predict(X[start:stop])
+
+    lean = LazyRegressionResult(result, predict_rows, y, chunk_rows)
+    return lean
+
+
+COV_TYPES = ('nonrobust', 'HC0', 'HC1', 'HC2', 'HC3')
+
+
+def compute_coefficient_inference(X: np.ndarray, residuals: np.ndarray, coefficients: np.ndarray,
+                                  intercept: float, r_factor: Optional[np.ndarray] = None,
+                                  cov_type: str = "nonrobust", confidence: float = 0.95,
+                                  use_t: Optional[bool] = None) -> Dict[str, Any]:
+    """
+    Standard errors, tests and confidence intervals of OLS coefficients.
+
+    Uses the upper-triangular factor ``R`` of the centered Gram matrix cached
+    by the native solvers (factorized once from ``X`` otherwise). With the
+    centered design ``[1, Xc]`` the bread of the sandwich is block diagonal,
+    ``diag(1/n, R^-1 R^-T)``, and leverages are ``1/n + xc_i^T (R^T R)^-1 xc_i``
+    computed for all rows at once, so no refit is needed.
+
+    Args:
+        X: Training feature matrix
+        residuals: Training residuals
+        coefficients: Slope coefficients
+        intercept: Intercept
+        r_factor: Cached Cholesky factor of the centered Gram matrix
+        cov_type: 'nonrobust' or heteroscedasticity-robust 'HC0'-'HC3'
+        confidence: Confidence level of the intervals
+        use_t: Use the t distribution (defaults to True for 'nonrobust' and
+            False for the robust variants, as statsmodels does)
+
+    Returns:
+        Dictionary with params, std_errors, t_values, p_values, ci_lower,
+        ci_upper (intercept first), covariance, cov_type and df_resid
+    """
+    if cov_type not in COV_TYPES:
+        raise ValueError(f"Unknown cov_type: {cov_type}. Supported: {', '.join(COV_TYPES)}")
+    X = np.asarray(X, dtype=np.float64)
+    residuals = np.asarray(residuals, dtype=np.float64)
+    n, p = X.shape
+    k = p + 1
+    df_resid = n - k
+    if df_resid <= 0:
+        raise ValueError(f"Need more than {k} observations, got {n}")
+
+    x_mean = X.mean(axis=0)
+    centered = X - x_mean
+    if r_factor is None:
+        try:
+            r_factor = linalg.cholesky(centered.T @ centered, lower=False)
+        except linalg.LinAlgError:
+            pass
+    if r_factor is not None:
+        r_inv = linalg.solve_triangular(r_factor, np.eye(p))
+        gram_inv = r_inv @ r_inv.T
+    else:
+        gram_inv = linalg.pinvh(centered.T @ centered)
+
+    if cov_type == "nonrobust":
+        sigma2 = residuals @ residuals / df_resid
+        bread_cov = np.zeros((k, k))
+        bread_cov[0, 0] = 1.0 / n
+        bread_cov[1:, 1:] = gram_inv
+        centered_cov = sigma2 * bread_cov
+    else:
+        weights = residuals ** 2
+        if cov_type == "HC1":
+            weights = weights * n / df_resid
+        elif cov_type in ("HC2", "HC3"):
+            leverage = 1.0 / n + np.einsum('ij,ij->i', centered @ gram_inv, centered)
+            weights = weights / (1.0 - leverage) ** (1 if cov_type == "HC2" else 2)
+        # Meat of the sandwich for the centered design [1, Xc]
+        weighted = centered * weights[:, None]
+        meat = np.empty((k, k))
+        meat[0, 0] = weights.sum()
+        meat[0, 1:] = meat[1:, 0] = weighted.sum(axis=0)
+        meat[1:, 1:] = weighted.T @ centered
+        bread = np.zeros((k, k))
+        bread[0, 0] = 1.0 / n
+        bread[1:, 1:] = gram_inv
+        centered_cov = bread @ meat @ bread
+
+    # Back to the uncentered intercept: b0 = b0c - x_mean @ beta
+    transform = np.eye(k)
+    transform[0, 1:] = -x_mean
+    covariance = transform @ centered_cov @ transform.T
+
+    params = np.concatenate([[intercept], np.ravel(coefficients)])
+    std_errors = np.sqrt(np.diagonal(covariance))
+    t_values = params / std_errors
+    if use_t is None:
+        use_t = cov_type == "nonrobust"
+    distribution = stats.t(df_resid) if use_t else stats.norm()
+    p_values = 2 * distribution.sf(np.abs(t_values))
+    critical = distribution.ppf(0.5 + confidence / 2)
+
+    return {
+        'params': params,
+        'std_errors': std_errors,
+        't_values': t_values,
+        'p_values': p_values,
+        'ci_lower': params - critical * std_errors,
+        'ci_upper': params + critical * std_errors,
+        'covariance': covariance,
+        'cov_type': cov_type,
+        'df_resid': df_resid
+    }
+
+
 def compute_residuals_analysis(residuals: np.ndarray) -> Dict[str, Any]:
     """Analyze regression residuals."""
     return {
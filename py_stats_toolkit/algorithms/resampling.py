@@ -0,0 +1,228 @@
+"""Pure resampling algorithms (bootstrap, permutation) for correlation statistics."""
+
+from functools import partial
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+from scipy import stats
+
+from py_stats_toolkit.algorithms.correlation import (
+    compute_pearson_gemm,
+    rank_columns,
+    standardize_columns,
+)
+from py_stats_toolkit.utils.parallel import ParallelProcessor
+
+BATCH_MEMORY = 1 << 26
+EARLY_STOP_BATCH = 1000
+
+
+def _resample_counts(rng: np.random.Generator, n: int, size: int) -> np.ndarray:
+    """Draw a (size, n) matrix of resample indices and turn it into row multiplicities."""
+    indices = rng.integers(0, n, size=(size, n))
+    indices += np.arange(size)[:, None] * n
+    return np.bincount(indices.ravel(), minlength=size * n).reshape(size, n).astype(np.float64)
+
+
+def _bootstrap_pair_batch(task: Tuple[np.random.SeedSequence, int],
+                          features: np.ndarray) -> np.ndarray:
+    """Correlations of one batch of pair resamples from weighted sufficient statistics."""
+    seed, size = task
+    n = features.shape[0]
+    weights = _resample_counts(np.random.default_rng(seed), n, size)
+    sum_x, sum_y, sum_xx, sum_yy, sum_xy = (weights @ features).T / n
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cov = sum_xy - sum_x * sum_y
+        corr = cov / np.sqrt((sum_xx - sum_x ** 2) * (sum_yy - sum_y ** 2))
+    return np.clip(corr, -1.0, 1.0)
+
+
+def _bootstrap_matrix_batch(task: Tuple[np.random.SeedSequence, int],
+                            X: np.ndarray) -> np.ndarray:
+    """Upper-triangle correlations of one batch of matrix resamples."""
+    seed, size = task
+    n, p = X.shape
+    weights = _resample_counts(np.random.default_rng(seed), n, size)
+    means = weights @ X / n
+    upper = np.triu_indices(p, k=1)
+    out = np.empty((size, upper[0].size))
+
+    for b in range(size):
+        cov = (X * weights[b][:, None]).T @ X / n - np.outer(means[b], means[b])
+        scale = np.sqrt(np.diagonal(cov))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            out[b] = (cov / np.outer(scale, scale))[upper]
+    return np.clip(out, -1.0, 1.0)
+
+
+def bootstrap_correlation(x: np.ndarray, y: Optional[np.ndarray] = None,
+                          n_resamples: int = 1000, confidence: float = 0.95,
+                          batch_size: Optional[int] = None,
+                          random_state: Optional[int] = None,
+                          n_jobs: int = 1) -> Dict[str, Any]:
+    """
+    Compute percentile bootstrap confidence intervals for Pearson correlations.
+
+    Each batch draws its resamples as a matrix of row multiplicities and gets
+    the weighted sufficient statistics of all replicates with one matrix
+    product (one weighted GEMM per replicate for a correlation matrix).
+    Batches are seeded by spawning a ``SeedSequence`` so results are identical
+    whatever the number of workers.
+
+    Args:
+        x: 1D array, or 2D array of shape (n_samples, n_features) when ``y`` is None
+        y: Optional second 1D array for a single correlation coefficient
+        n_resamples: Number of bootstrap replicates
+        confidence: Confidence level of the percentile intervals
+        batch_size: Replicates per batch (derived from the sample size if None)
+        random_state: Seed for reproducible resampling
+        n_jobs: Number of worker processes sharing the batches
+
+    Returns:
+        Dictionary with 'correlation', 'ci_lower', 'ci_upper', 'standard_error'
+        (scalars for a pair, matrices otherwise) and 'n_resamples'; the pair
+        case also returns the 'replicates'
+    """
+    X = np.asarray(x, dtype=np.float64)
+    if y is not None:
+        X = np.column_stack([X.ravel(), np.asarray(y, dtype=np.float64).ravel()])
+    if X.ndim != 2 or X.shape[0] < 2:
+        raise ValueError("Need a 2D sample with at least two rows")
+    if n_resamples < 1:
+        raise ValueError(f"n_resamples must be a positive integer, got {n_resamples}")
+
+    n, p = X.shape
+    X = X - X.mean(axis=0)
+    if batch_size is None:
+        batch_size = max(1, BATCH_MEMORY // (8 * n))
+    sizes = [min(batch_size, n_resamples - start) for start in range(0, n_resamples, batch_size)]
+    seeds = np.random.SeedSequence(random_state).spawn(len(sizes))
+    tasks = list(zip(seeds, sizes))
+    processor = ParallelProcessor(n_jobs=n_jobs)
+
+    if y is not None:
+        features = np.column_stack([X[:, 0], X[:, 1], X[:, 0] ** 2, X[:, 1] ** 2, X[:, 0] * X[:, 1]])
+        batches = processor.parallel_map(partial(_bootstrap_pair_batch, features=features),
+                                         tasks, min_items=2)
+    else:
+        batches = processor.parallel_map(partial(_bootstrap_matrix_batch, X=X), tasks, min_items=2)
+    replicates = np.concatenate(batches)
+
+    alpha = 1.0 - confidence
+    with np.errstate(invalid='ignore'):
+        lower, upper = np.nanpercentile(replicates, [100 * alpha / 2, 100 * (1 - alpha / 2)], axis=0)
+    standard_error = np.nanstd(replicates, axis=0, ddof=1)
+    estimate = compute_pearson_gemm(X)
+
+    if y is not None:
+        return {
+            'correlation': float(estimate[0, 1]),
+            'ci_lower': float(lower),
+            'ci_upper': float(upper),
+            'standard_error': float(standard_error),
+            'n_resamples': n_resamples,
+            'replicates': replicates,
+        }
+
+    def to_matrix(values: np.ndarray, diagonal: float) -> np.ndarray:
+        matrix = np.full((p, p), diagonal)
+        i, j = np.triu_indices(p, k=1)
+        matrix[i, j] = values
+        matrix[j, i] = values
+        return matrix
+
+    return {
+        'correlation': estimate,
+        'ci_lower': to_matrix(lower, 1.0),
+        'ci_upper': to_matrix(upper, 1.0),
+        'standard_error': to_matrix(standard_error, 0.0),
+        'n_resamples': n_resamples,
+    }
+
+
+def _pvalue_resolved(extreme: int, done: int, alpha: float, level: float = 0.99) -> bool:
+    """Check whether the Clopper-Pearson interval of the p-value excludes alpha."""
+    lower = stats.beta.ppf((1 - level) / 2, extreme, done - extreme + 1) if extreme else 0.0
+    upper = stats.beta.ppf((1 + level) / 2, extreme + 1, done - extreme) if extreme < done else 1.0
+    return upper < alpha or lower > alpha
+
+
+def permutation_correlation_test(x: np.ndarray, y: np.ndarray, method: str = "pearson",
+                                 n_permutations: int = 9999,
+                                 alternative: str = "two-sided",
+                                 batch_size: Optional[int] = None,
+                                 alpha: Optional[float] = None,
+                                 random_state: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Compute a permutation p-value for a correlation coefficient.
+
+    Both series are standardized once (after ranking for Spearman). Each
+    block of permutations is a matrix of shuffled indices, and all permuted
+    correlations of the block come from a single matrix product. When
+    ``alpha`` is given, sampling stops as soon as a 99% Clopper-Pearson
+    interval of the p-value lies entirely on one side of ``alpha``.
+
+    Args:
+        x: 1D array
+        y: 1D array of the same length
+        method: Correlation method ('pearson' or 'spearman')
+        n_permutations: Maximum number of permutations
+        alternative: 'two-sided', 'greater' or 'less'
+        batch_size: Permutations per block (derived from the sample size if None,
+            and at most EARLY_STOP_BATCH when alpha is given)
+        alpha: Significance level enabling early stopping (None to disable)
+        random_state: Seed for reproducible permutations
+
+    Returns:
+        Dictionary with 'correlation', 'p_value', 'n_permutations' (actually
+        drawn) and 'early_stopped'
+    """
+    data = np.column_stack([np.asarray(x, dtype=np.float64).ravel(),
+                            np.asarray(y, dtype=np.float64).ravel()])
+    if method == "spearman":
+        data = rank_columns(data)
+    elif method != "pearson":
+        raise ValueError(f"Permutation tests support 'pearson' and 'spearman', got '{method}'")
+    if alternative not in ("two-sided", "greater", "less"):
+        raise ValueError(f"Unknown alternative: {alternative}")
+
+    Z = standardize_columns(data, copy=False)
+    zx, zy = Z[:, 0], Z[:, 1]
+    n = zx.shape[0]
+    observed = float(np.clip(zx @ zy, -1.0, 1.0))
+    # Tolerance so that permutations reproducing the observed value count as extreme
+    tolerance = 1e-12 * max(1.0, abs(observed))
+
+    if batch_size is None:
+        batch_size = max(1, BATCH_MEMORY // (8 * n))
+        if alpha is not None:
+            # Small blocks so the stopping rule is checked on small samples too
+            batch_size = min(batch_size, EARLY_STOP_BATCH)
+    rng = np.random.default_rng(random_state)
+    extreme = 0
+    done = 0
+    early_stopped = False
+
+    while done < n_permutations:
+        size = min(batch_size, n_permutations - done)
+        indices = rng.permuted(np.broadcast_to(np.arange(n), (size, n)), axis=1)
+        permuted = zy[indices] @ zx
+        if alternative == "two-sided":
+            extreme += int(np.count_nonzero(np.abs(permuted) >= abs(observed) - tolerance))
+        elif alternative == "greater":
+            extreme += int(np.count_nonzero(permuted >= observed - tolerance))
+        else:
+            extreme += int(np.count_nonzero(permuted <= observed + tolerance))
+        done += size
+
+        if alpha is not None and done < n_permutations and _pvalue_resolved(extreme, done, alpha):
+            early_stopped = True
+            break
+
+    return {
+        'correlation': observed,
+        'p_value': (extreme + 1) / (done + 1),
+        'n_permutations': done,
+        'early_stopped': early_stopped,
+    }
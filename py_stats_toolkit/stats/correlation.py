@@ -1,15 +1,20 @@
 """
 Correlation analysis module.
 
-Provides the CorrelationAnalysis class for computing correlations between variables.
+Provides the CorrelationAnalysis class for computing correlations between variables
+and the RollingCorrelation class for windowed correlations.
 """
 
-from typing import Any, Dict, Union
+from typing import Any, Dict, Optional, Union
 
 import numpy as np
 import pandas as pd
+from numpy.typing import DTypeLike
 from scipy import stats
 
+from py_stats_toolkit.algorithms import correlation as correlation_algos
+from py_stats_toolkit.algorithms import dependence as dependence_algos
+
 
 class CorrelationAnalysis:
     """
@@ -19,29 +24,40 @@ class CorrelationAnalysis:
     different correlation methods (Pearson, Spearman, Kendall).
     """
 
-    def __init__(self, method: str = "pearson"):
+    def __init__(self, method: str = "pearson", dtype: DTypeLike = np.float64):
         """
         Initialize CorrelationAnalysis.
 
         Args:
             method: Correlation method ('pearson', 'spearman', or 'kendall')
+            dtype: Accumulation type for the matrix engine (np.float64 or np.float32)
         """
         valid_methods = {"pearson", "spearman", "kendall"}
         if method not in valid_methods:
             raise ValueError(f"Method must be one of {valid_methods}, got '{method}'")
         self.method = method
+        self.dtype = dtype
 
     def analyze(
         self,
         data: Union[pd.DataFrame, pd.Series, np.ndarray],
         y: Union[pd.Series, np.ndarray, None] = None,
+        with_p_values: bool = False,
+        confidence: float = 0.95,
+        adjust: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Perform correlation analysis.
 
         Args:
             data: Input data (DataFrame, Series, or array)
-            y: Optional second variable for bivariate correlation
+            y: Optional second variable for bivariate correlation; with a 2D
+                ``data`` every column is correlated against ``y``
+            with_p_values: For DataFrames, also return p-value and confidence
+                interval matrices
+            confidence: Confidence level of the intervals
+            adjust: Optional multiple-testing correction ('bonferroni', 'holm',
+                'fdr_bh', ...)
 
         Returns:
             Dictionary containing correlation results
@@ -55,14 +71,44 @@ class CorrelationAnalysis:
 
             return {"correlation": 1.0, "method": self.method, "n": len(data_array)}
 
+        # One-vs-many case - correlate every column against y at once
+        if y is not None and np.ndim(data) == 2:
+            result = correlation_algos.compute_correlation_with_target(
+                np.asarray(data), np.asarray(y), self.method
+            )
+            correlation, p_value = result["correlation"], result["p_value"]
+            if isinstance(data, pd.DataFrame):
+                correlation = pd.Series(correlation, index=data.columns)
+                p_value = pd.Series(p_value, index=data.columns)
+
+            return {
+                "correlation": correlation,
+                "p_value": p_value,
+                "method": self.method,
+                "n": len(data),
+            }
+
         # DataFrame case - compute correlation matrix
         if isinstance(data, pd.DataFrame):
+            if with_p_values:
+                result = correlation_algos.compute_correlation_matrix_test(
+                    data, self.method, confidence=confidence, adjust=adjust, dtype=self.dtype
+                )
+                result["method"] = self.method
+                return result
+
             if self.method == "pearson":
-                corr_matrix = data.corr(method="pearson")
+                corr_matrix = correlation_algos.compute_correlation_matrix(
+                    data, method="pearson", dtype=self.dtype
+                )
             elif self.method == "spearman":
-                corr_matrix = data.corr(method="spearman")
+                corr_matrix = correlation_algos.compute_correlation_matrix(
+                    data, method="spearman", dtype=self.dtype
+                )
             elif self.method == "kendall":
-                corr_matrix = data.corr(method="kendall")
+                corr_matrix = correlation_algos.compute_correlation_matrix(
+                    data, method="kendall"
+                )
             else:
                 raise ValueError(f"Unknown correlation method: {self.method}")
 
@@ -81,7 +127,7 @@ class CorrelationAnalysis:
             if self.method == "pearson":
                 corr, pval = stats.pearsonr(data, y)
             elif self.method == "spearman":
-                corr, pval = stats.spearmanr(data, y)
+                corr, pval = correlation_algos.compute_spearman_test(data, y)
             elif self.method == "kendall":
                 corr, pval = stats.kendalltau(data, y)
             else:
@@ -97,3 +143,194 @@ class CorrelationAnalysis:
         raise ValueError(
             "Invalid input: provide either a DataFrame or two arrays/Series"
         )
+
+    def dependence_matrix(
+        self,
+        data: pd.DataFrame,
+        measure: str = "mutual_information",
+        n_jobs: int = 1,
+        **kwargs: Any,
+    ) -> pd.DataFrame:
+        """
+        Compute a nonlinear dependence matrix between columns.
+
+        Args:
+            data: Input DataFrame without missing values
+            measure: 'mutual_information' (quantile-binned, in nats) or
+                'distance_correlation'
+            n_jobs: Number of worker processes sharing the pairs
+            **kwargs: Passed to the algorithm (n_bins, normalized, bias_corrected)
+
+        Returns:
+            Dependence matrix labelled with the DataFrame columns
+        """
+        values = data.to_numpy(dtype=np.float64)
+        if measure == "mutual_information":
+            matrix = dependence_algos.compute_mutual_information_matrix(values, n_jobs=n_jobs, **kwargs)
+        elif measure == "distance_correlation":
+            matrix = dependence_algos.compute_distance_correlation_matrix(values, n_jobs=n_jobs, **kwargs)
+        else:
+            raise ValueError(f"Unknown dependence measure: {measure}")
+
+        return pd.DataFrame(matrix, index=data.columns, columns=data.columns)
+
+    def cross_correlation(
+        self,
+        x: Union[pd.Series, np.ndarray],
+        y: Union[pd.DataFrame, pd.Series, np.ndarray],
+        max_lag: Optional[int] = None,
+        confidence: float = 0.95,
+    ) -> Dict[str, Any]:
+        """
+        Compute the lagged Pearson cross-correlation of x against y.
+
+        Args:
+            x: Leading candidate series
+            y: Series, or 2D array/DataFrame of series, of the same length
+            max_lag: Largest lag in both directions (defaults to n - 1)
+            confidence: Confidence level of the white-noise band
+
+        Returns:
+            Dictionary with 'lags', 'ccf' (DataFrame indexed by lag when y is a
+            DataFrame), 'confidence_band' and 'n'; a peak at a positive lag
+            means x leads y
+        """
+        result = correlation_algos.compute_cross_correlation(
+            np.asarray(x), np.asarray(y), max_lag=max_lag, confidence=confidence
+        )
+        if isinstance(y, pd.DataFrame):
+            result["ccf"] = pd.DataFrame(result["ccf"], index=result["lags"], columns=y.columns)
+        return result
+
+
+class RollingCorrelation:
+    """
+    Rolling Pearson correlation and covariance between series.
+
+    Correlates one target series against one or many others over a sliding
+    window, either on whole arrays with analyze() or one observation at a time
+    with update(). Both keep sliding sums of x, y, x^2, y^2 and xy, so each
+    step costs O(k) for k compared series whatever the window length.
+    """
+
+    def __init__(self, window: int, min_periods: Optional[int] = None):
+        """
+        Initialize RollingCorrelation.
+
+        Args:
+            window: Number of trailing observations in each window
+            min_periods: Minimum number of complete pairs (defaults to window)
+        """
+        if window < 1:
+            raise ValueError(f"window must be a positive integer, got {window}")
+        self.window = window
+        self.min_periods = window if min_periods is None else min_periods
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all streamed observations."""
+        self._x = None
+        self._y = None
+        self._position = 0
+        self._seen = 0
+        self._shift = None
+        self._sums = None
+
+    def analyze(
+        self,
+        x: Union[pd.Series, np.ndarray],
+        y: Union[pd.DataFrame, pd.Series, np.ndarray],
+    ) -> Dict[str, Any]:
+        """
+        Compute rolling correlations over whole series.
+
+        Args:
+            x: Target series of length n
+            y: Series of length n, or 2D array/DataFrame of n rows to correlate
+                against ``x`` column by column
+
+        Returns:
+            Dictionary containing 'correlation' and 'covariance' (Series or
+            DataFrame when ``y`` is a pandas object), 'window' and 'n'
+        """
+        moments = correlation_algos.compute_rolling_moments(
+            np.asarray(x), np.asarray(y), self.window, self.min_periods
+        )
+        correlation, covariance = moments["correlation"], moments["covariance"]
+
+        if isinstance(y, pd.DataFrame):
+            correlation = pd.DataFrame(correlation, index=y.index, columns=y.columns)
+            covariance = pd.DataFrame(covariance, index=y.index, columns=y.columns)
+        elif isinstance(y, pd.Series):
+            correlation = pd.Series(correlation, index=y.index, name=y.name)
+            covariance = pd.Series(covariance, index=y.index, name=y.name)
+
+        return {
+            "correlation": correlation,
+            "covariance": covariance,
+            "window": self.window,
+            "n": len(correlation),
+        }
+
+    def _recompute_sums(self) -> None:
+        """Rebuild the sliding sums from the buffer to discard rounding drift."""
+        filled = min(self._seen, self.window)
+        terms = self._contribution(self._x[:filled, None], self._y[:filled])
+        self._sums = terms.sum(axis=1)
+
+    def _contribution(self, x_value: Union[float, np.ndarray],
+                      y_values: np.ndarray) -> np.ndarray:
+        """Sliding-sum terms contributed by one observation (or a stack of them)."""
+        x = x_value - self._shift[0]
+        y = y_values - self._shift[1]
+        observed = ~(np.isnan(x) | np.isnan(y))
+        x = np.where(observed, x, 0.0)
+        y = np.where(observed, y, 0.0)
+        return np.stack([observed.astype(np.float64), x, y, x * x, y * y, x * y])
+
+    def update(self, x_value: float,
+               y_values: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        Add one observation and return the current rolling correlation.
+
+        Args:
+            x_value: New value of the target series
+            y_values: New value of the compared series (scalar or length-k array)
+
+        Returns:
+            Correlation over the current window (NaN until min_periods pairs)
+        """
+        scalar = np.ndim(y_values) == 0
+        y_values = np.atleast_1d(np.asarray(y_values, dtype=np.float64))
+        x_value = float(x_value)
+
+        if self._x is None:
+            self._x = np.full(self.window, np.nan)
+            self._y = np.full((self.window, y_values.size), np.nan)
+            self._shift = (0.0 if np.isnan(x_value) else x_value,
+                           np.where(np.isnan(y_values), 0.0, y_values))
+            self._sums = np.zeros((6, y_values.size))
+        elif y_values.size != self._y.shape[1]:
+            raise ValueError(f"Expected {self._y.shape[1]} values, got {y_values.size}")
+
+        if self._seen >= self.window:
+            self._sums -= self._contribution(self._x[self._position], self._y[self._position])
+        self._x[self._position] = x_value
+        self._y[self._position] = y_values
+        self._sums += self._contribution(x_value, y_values)
+        self._position = (self._position + 1) % self.window
+        self._seen += 1
+
+        if self._position == 0:
+            self._recompute_sums()
+
+        count, sum_x, sum_y, sum_xx, sum_yy, sum_xy = self._sums
+        with np.errstate(divide="ignore", invalid="ignore"):
+            comoment = sum_xy - sum_x * sum_y / count
+            var_x = np.maximum(sum_xx - sum_x ** 2 / count, 0.0)
+            var_y = np.maximum(sum_yy - sum_y ** 2 / count, 0.0)
+            correlation = np.clip(comoment / np.sqrt(var_x * var_y), -1.0, 1.0)
+        correlation[(var_x <= 1e-14 * sum_xx) | (var_y <= 1e-14 * sum_yy)] = np.nan
+        correlation[count < max(self.min_periods, 2)] = np.nan
+
+        return float(correlation[0]) if scalar else correlation
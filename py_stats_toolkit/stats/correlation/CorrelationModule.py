@@ -18,35 +18,13 @@ tags : module, stats, refactored
 =====================================================================
 """
 
-tags : module, stats
-"""
-from typing import List, Tuple, Union
+from typing import Any, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
-from scipy import stats
-
-from ...utils.parallel import ParallelProcessor
-from ..core.AbstractClassBase import StatisticalModule
-
-
-class CorrelationModule(StatisticalModule):
-    """Module pour l'analyse de corrélation."""
-
-    def __init__(self, n_jobs: int = -1):
-        super().__init__()
-        self.method = None
-        self.parallel_processor = ParallelProcessor(n_jobs=n_jobs)
-
-    def process(self, data, method="pearson", **kwargs):
-        """
-        Calcule la corrélation entre les variables.
-
-        Args:
-            data: Données d'entrée (pandas DataFrame)
-            method: Méthode de corrélation ('pearson', 'spearman', 'kendall')
-            **kwargs: Arguments additionnels
 
 from py_stats_toolkit.algorithms import correlation as correlation_algos
+from py_stats_toolkit.algorithms import covariance as covariance_algos
 from py_stats_toolkit.core.base import StatisticalModule
 from py_stats_toolkit.core.validators import DataValidator
 
@@ -65,57 +43,56 @@ class CorrelationModule(StatisticalModule):
     - correlation_algos for computations
     """
 
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize correlation module."""
         super().__init__()
         self.method = None
+        self.accumulator = None
 
-    def process(self, data: Union[pd.DataFrame, pd.Series], method: str = "pearson",
-                **kwargs) -> pd.DataFrame:
+    def process(self, data: Union[pd.DataFrame, np.ndarray], method: str = "pearson",
+                **kwargs: Any) -> Union[pd.DataFrame, np.ndarray]:
         """
         Compute correlation between variables.
 
         Args:
-            data: Input DataFrame
+            data: Input DataFrame, or a 2D (possibly memory-mapped) array for
+                the blocked out-of-core engine
             method: Correlation method ('pearson', 'spearman', 'kendall')
             **kwargs: Additional arguments
+                - dtype: Accumulation type of the Pearson engine
+                - n_jobs: Worker processes used to rank columns for Spearman
+                - out: Output array or ``.npy`` path for the blocked engine
+                - block_size: Columns per block for the blocked engine
+                - memory_budget: Bytes available to the blocked engine
+                - incremental: Keep a co-moment accumulator so that rows can
+                  later be appended with update() (pearson only)
+                - shrinkage: 'ledoit_wolf' or 'oas' to return the shrunk
+                  correlation estimate instead of the sample one (pearson only)
 
         Returns:
-            Correlation matrix
-        """
-        self.validate_data(data)
-        self.method = method
-
-        if not isinstance(data, pd.DataFrame):
-            raise TypeError("Les données doivent être un pandas DataFrame")
-
-        # Compute correlation matrix directly
-        # pandas/numpy already use optimized algorithms
-        # Note: Chunking correlation computation produces incorrect results because
-        # correlation requires all data points to compute proper covariance and variance statistics
-        self.result = data.corr(method=method)
-        return self.result
-
-    def get_correlation_matrix(self):
-        """Retourne la matrice de corrélation."""
-        return self.result
-
-    def get_correlation_pairs(self, threshold=0.5):
+            Correlation matrix (DataFrame for DataFrame input, ndarray otherwise)
         """
-        Retourne les paires de variables avec une corrélation supérieure au seuil.
-
-        Args:
-            threshold: Seuil de corrélation
         # Validation (delegated to validator)
         DataValidator.validate_data(data)
 
+        if isinstance(data, np.ndarray):
+            if method != "pearson":
+                raise ValueError("The blocked engine only supports method='pearson'.")
+            DataValidator.validate_numeric(data)
+            self.data = data
+            self.method = method
+            self.accumulator = None
+            self.result = correlation_algos.compute_correlation_blocked(
+                data,
+                out=kwargs.get('out'),
+                block_size=kwargs.get('block_size'),
+                memory_budget=kwargs.get('memory_budget', correlation_algos.DEFAULT_MEMORY_BUDGET),
+                dtype=kwargs.get('dtype', np.float64),
+            )
+            return self.result
+
         if not isinstance(data, pd.DataFrame):
             raise TypeError(f"Data must be a pandas DataFrame. Got {type(data).__name__} instead.")
-import numpy as np
-import pandas as pd
-from scipy import stats
-from ..core.AbstractClassBase import StatisticalModule
-from ...utils.parallel import ParallelProcessor, get_optimal_chunk_size
 
         DataValidator.validate_numeric(data)
 
@@ -124,11 +101,59 @@ from ...utils.parallel import ParallelProcessor, get_optimal_chunk_size
         self.method = method
 
         # Computation (delegated to algorithm layer)
-        self.result = correlation_algos.compute_correlation_matrix(data, method)
+        if kwargs.get('shrinkage') is not None:
+            if method != "pearson":
+                raise ValueError("Shrinkage estimators only support method='pearson'.")
+            self.accumulator = None
+            estimate = covariance_algos.compute_shrinkage_covariance(data, kwargs['shrinkage'])
+            self.result = pd.DataFrame(
+                estimate['correlation'], index=data.columns, columns=data.columns
+            )
+            return self.result
+
+        if kwargs.get('incremental', False):
+            if method != "pearson":
+                raise ValueError("Incremental updates only support method='pearson'.")
+            self.accumulator = correlation_algos.CorrelationAccumulator(
+                dtype=kwargs.get('dtype', np.float64)
+            ).update(data)
+            self.result = pd.DataFrame(
+                self.accumulator.correlation(), index=data.columns, columns=data.columns
+            )
+            return self.result
+
+        self.accumulator = None
+        self.result = correlation_algos.compute_correlation_matrix(
+            data, method, dtype=kwargs.get('dtype', np.float64), n_jobs=kwargs.get('n_jobs', 1)
+        )
+
+        return self.result
 
+    def update(self, rows: Union[pd.DataFrame, np.ndarray]) -> pd.DataFrame:
+        """
+        Append rows and refresh the correlation matrix without a full recompute.
+
+        Args:
+            rows: New rows with the same columns as the processed data
+
+        Returns:
+            Updated correlation matrix
+        """
+        if self.accumulator is None:
+            raise ValueError("No incremental analysis performed. "
+                             "Call process(data, incremental=True) first.")
+
+        if isinstance(rows, pd.DataFrame):
+            DataValidator.validate_columns(rows, list(self.result.columns))
+            rows = rows[self.result.columns]
+
+        self.accumulator.update(rows)
+        self.result = pd.DataFrame(
+            self.accumulator.correlation(), index=self.result.index, columns=self.result.columns
+        )
         return self.result
 
-    def get_correlation_matrix(self) -> pd.DataFrame:
+    def get_correlation_matrix(self) -> Union[pd.DataFrame, np.ndarray]:
         """
         Get the correlation matrix.
 
@@ -137,47 +162,66 @@ from ...utils.parallel import ParallelProcessor, get_optimal_chunk_size
         """
         return self.get_result()
 
-    def get_correlation_pairs(self, threshold: float = 0.5) -> List[Tuple[str, str, float]]:
+    def get_correlation_pairs(self, threshold: float = 0.5,
+                              top_k: Optional[int] = None) -> List[Tuple[str, str, float]]:
         """
         Get variable pairs with correlation above threshold.
 
         Args:
             threshold: Minimum absolute correlation value
+            top_k: Maximum number of pairs to return (all if None)
 
         Returns:
-            List of (var1, var2, correlation) tuples
+            List of (var1, var2, correlation) tuples, strongest first
         """
-        if self.result is None:
-            raise ValueError("Exécutez d'abord process()")
+        if not self.has_result():
+            raise ValueError("No analysis performed. Call process() first.")
+
+        # Extract pairs from the already-computed correlation matrix
+        corr_matrix = self.result
+        if isinstance(corr_matrix, pd.DataFrame):
+            cols = corr_matrix.columns
+            corr_matrix = corr_matrix.values
+        else:
+            cols = pd.RangeIndex(corr_matrix.shape[1])
 
-        # Utilisation de numpy pour le calcul parallèle des paires
-        corr_matrix = self.result.to_numpy()
-        n = len(self.result.columns)
+        pairs = correlation_algos.select_pairs(corr_matrix, threshold=threshold, top_k=top_k)
+        return list(zip(cols[pairs['i']], cols[pairs['j']], pairs['r'].tolist()))
 
-        # Création des indices pour les paires
-        i, j = np.triu_indices(n, k=1)
-        corr_values = corr_matrix[i, j]
+    def get_partial_correlation_matrix(self,
+                                       shrinkage: Union[float, str, None] = None) -> pd.DataFrame:
+        """
+        Get partial correlations of every pair given all other variables.
 
-        # Filtrage des paires selon le seuil
-        mask = np.abs(corr_values) >= threshold
-        mask_indices = np.where(mask)[0]
+        Computed from one inversion of the already-computed covariance
+        (incremental mode) or Pearson correlation matrix.
 
-        # Vectorized construction of pairs using list comprehension
-        pairs = [
-            (self.result.columns[i[idx]], self.result.columns[j[idx]], corr_values[idx])
-            for idx in mask_indices
-        ]
+        Args:
+            shrinkage: Optional intensity in [0, 1] shrinking off-diagonal
+                entries toward zero before inversion, or 'ledoit_wolf' / 'oas'
+                to invert the corresponding shrinkage estimate of the processed
+                data (not available after update())
 
+        Returns:
+            Partial correlation matrix
+        """
         if not self.has_result():
             raise ValueError("No analysis performed. Call process() first.")
-
-        # Extract pairs from the already-computed correlation matrix
-        corr_matrix = self.result
-        pairs = []
-        cols = corr_matrix.columns
-        for i in range(len(cols)):
-            for j in range(i + 1, len(cols)):
-                corr_value = corr_matrix.iloc[i, j]
-                if abs(corr_value) >= threshold:
-                    pairs.append((cols[i], cols[j], corr_value))
-        return sorted(pairs, key=lambda x: abs(x[2]), reverse=True)
+        if self.method != "pearson":
+            raise ValueError("Partial correlations require method='pearson'.")
+
+        if isinstance(shrinkage, str):
+            if self.accumulator is not None and self.accumulator.count != len(self.data):
+                raise ValueError("Shrinkage estimators need the raw rows, which update() does not "
+                                 "keep. Call process() on the full data instead.")
+            cov = covariance_algos.compute_shrinkage_covariance(self.data, shrinkage)['covariance']
+            shrinkage = None
+        elif self.accumulator is not None:
+            cov = self.accumulator.covariance()
+        else:
+            cov = np.asarray(self.result)
+
+        partial = correlation_algos.compute_partial_correlation(cov, shrinkage=shrinkage)
+        if isinstance(self.result, pd.DataFrame):
+            return pd.DataFrame(partial, index=self.result.index, columns=self.result.columns)
+        return partial
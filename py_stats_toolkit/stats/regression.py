@@ -10,6 +10,8 @@ import numpy as np
 from sklearn.linear_model import LinearRegression as SKLearnLinearRegression
 from sklearn.metrics import mean_squared_error, r2_score
 
+from py_stats_toolkit.algorithms import regression as regression_algos
+
 
 class LinearRegression:
     """
@@ -22,6 +24,7 @@ class LinearRegression:
         """Initialize LinearRegression."""
         self.model = SKLearnLinearRegression()
         self.is_fitted = False
+        self.accumulator = None
 
     def fit(
         self, X: Union[np.ndarray, list], y: Union[np.ndarray, list]
@@ -39,10 +42,47 @@ class LinearRegression:
         X = np.array(X) if not isinstance(X, np.ndarray) else X
         y = np.array(y) if not isinstance(y, np.ndarray) else y
 
+        # A previous finalize() may have left a streamed OLSModel in place
+        self.model = SKLearnLinearRegression()
+        self.accumulator = None
         self.model.fit(X, y)
         self.is_fitted = True
         return self
 
+    def partial_fit(
+        self, X: Union[np.ndarray, list], y: Union[np.ndarray, list]
+    ) -> "LinearRegression":
+        """
+        Accumulate a chunk of rows without keeping the data.
+
+        Args:
+            X: Feature matrix chunk
+            y: Target vector chunk
+
+        Returns:
+            Self for method chaining
+        """
+        if self.accumulator is None:
+            self.accumulator = regression_algos.OLSAccumulator()
+        self.accumulator.partial_fit(X, y)
+        return self
+
+    def finalize(self) -> "LinearRegression":
+        """
+        Solve the model from the chunks passed to partial_fit.
+
+        The accumulator is cleared, so a later partial_fit() starts a new fit.
+
+        Returns:
+            Self for method chaining
+        """
+        if self.accumulator is None:
+            raise RuntimeError("No data accumulated. Call partial_fit() first.")
+        self.model = self.accumulator.finalize()["model"]
+        self.accumulator = None
+        self.is_fitted = True
+        return self
+
     def predict(self, X: Union[np.ndarray, list]) -> np.ndarray:
         """
         Make predictions using the fitted model.
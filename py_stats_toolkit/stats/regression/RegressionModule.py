@@ -18,7 +18,7 @@ tags : module, stats, refactored
 =====================================================================
 """
 
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -42,21 +42,40 @@ class RegressionModule(StatisticalModule):
     - regression_algos for computations
     """
 
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize regression module."""
         super().__init__()
+        self.accumulator = None
+        self.x_cols = None
 
-    def process(self, data: pd.DataFrame, x_cols: List[str], y_col: str,
-                regression_type: str = "linear", **kwargs) -> Dict[str, Any]:
+    def process(self, data: pd.DataFrame, x_cols: List[str], y_col: Union[str, List[str]],
+                regression_type: str = "linear", **kwargs: Any) -> Dict[str, Any]:
         """
         Perform regression analysis.
 
         Args:
             data: DataFrame with data
             x_cols: List of feature column names
-            y_col: Target column name
+            y_col: Target column name, or a list of target columns to fit them
+                all against the same features (linear regression only)
             regression_type: Type of regression ('linear', 'ridge', 'lasso', 'polynomial')
-            **kwargs: Additional arguments (alpha for ridge/lasso, degree for polynomial)
+            **kwargs: Additional arguments (alpha for ridge/lasso, degree for polynomial,
+                solver for linear: 'sklearn', 'cholesky' or 'qr'). A sequence of
+                ridge alphas fits the whole path and keeps the alpha with the
+                lowest leave-one-out error. A sequence of lasso alphas, or
+                alpha=None for the default grid, fits a warm-started path
+                (l1_ratio for elastic net) and keeps the alpha chosen by
+                criterion ('bic' by default, 'aic' or 'min_alpha'); the whole
+                path is returned under 'coefficient_path'. group_col fits one
+                model per group (n_jobs workers for non-linear types) with a
+                single alpha. chunk_rows for polynomial accumulates the
+                expanded Gram matrix chunk by chunk.
+                lean=True keeps only coefficients and summary statistics and
+                computes predictions and residuals on access; keep_data=False
+                drops the references to the input data. cov_type ('nonrobust',
+                'HC0'-'HC3') adds an 'inference' table of standard errors,
+                t statistics, p-values and confidence intervals (confidence)
+                for linear regression.
 
         Returns:
             Dictionary with regression results containing:
@@ -68,7 +87,19 @@ class RegressionModule(StatisticalModule):
             - 'model': Fitted model object
             - 'regression_type': Type of regression performed
             - Additional keys depending on regression type
+
+            With a list of targets, coefficients is an (n_targets, n_features)
+            array, intercept and r2_score are arrays, 'targets' lists the target
+            columns, and predictions and residuals are not kept.
         """
+        if isinstance(y_col, list):
+            self._reject_options(kwargs, ('group_col', 'cov_type', 'lean', 'solver'),
+                                 "a list of target columns")
+            return self._process_multi_target(data, x_cols, y_col, regression_type,
+                                              kwargs.get('keep_data', True))
+        if kwargs.get('group_col') is not None:
+            return self._process_grouped(data, x_cols, y_col, regression_type, **kwargs)
+
         # Validation (delegated to validator)
         DataValidator.validate_data(data)
         DataValidator.validate_columns(data, x_cols + [y_col])
@@ -76,27 +107,31 @@ class RegressionModule(StatisticalModule):
         # Extract features and target
         X = data[x_cols].values
         y = data[y_col].values
-from scipy import stats
-from sklearn.linear_model import LinearRegression, Ridge, Lasso
-from sklearn.preprocessing import PolynomialFeatures
-from ..core.AbstractClassBase import StatisticalModule
-from ...utils.parallel import ParallelProcessor
-
-        # Store state
-        self.data = data
 
         # Computation (delegated to algorithm layer)
         if regression_type == "linear":
-            result = regression_algos.compute_linear_regression(X, y)
+            solver = kwargs.get('solver', 'sklearn')
+            result = regression_algos.compute_linear_regression(X, y, solver=solver)
         elif regression_type == "ridge":
             alpha = kwargs.get('alpha', 1.0)
-            result = regression_algos.compute_ridge_regression(X, y, alpha)
+            if np.ndim(alpha) > 0:
+                result = regression_algos.compute_ridge_path(X, y, alpha)
+            else:
+                result = regression_algos.compute_ridge_regression(X, y, alpha)
         elif regression_type == "lasso":
             alpha = kwargs.get('alpha', 1.0)
-            result = regression_algos.compute_lasso_regression(X, y, alpha)
+            if alpha is None or np.ndim(alpha) > 0:
+                result = regression_algos.compute_lasso_path(
+                    X, y, alpha, l1_ratio=kwargs.get('l1_ratio', 1.0),
+                    criterion=kwargs.get('criterion', 'bic')
+                )
+            else:
+                result = regression_algos.compute_lasso_regression(X, y, alpha)
         elif regression_type == "polynomial":
             degree = kwargs.get('degree', 2)
-            result = regression_algos.compute_polynomial_regression(X, y, degree)
+            result = regression_algos.compute_polynomial_regression(
+                X, y, degree, chunk_rows=kwargs.get('chunk_rows')
+            )
         else:
             raise ValueError(
                 f"Unsupported regression type: {regression_type}. "
@@ -105,18 +140,152 @@ from ...utils.parallel import ParallelProcessor
 
         # Format results with column names
         result['regression_type'] = regression_type
+        cov_type = kwargs.get('cov_type')
+        if cov_type is not None:
+            if regression_type != "linear":
+                raise ValueError("Coefficient inference is only available for linear regression.")
+            result['inference'] = self._coefficient_table(result, X, x_cols, cov_type,
+                                                          kwargs.get('confidence', 0.95))
+
         if regression_type != 'polynomial':
             result['coefficients'] = dict(zip(x_cols, result['coefficients']))
 
+        return self._store_result(result, data, X, y, **kwargs)
+
+    @staticmethod
+    def _coefficient_table(result: Dict[str, Any], X: np.ndarray, x_cols: List[str],
+                           cov_type: str, confidence: float) -> pd.DataFrame:
+        """Tabulate coefficient inference from the fitted result."""
+        inference = regression_algos.compute_coefficient_inference(
+            X, result['residuals'], result['coefficients'], result['intercept'],
+            getattr(result['model'], 'r_factor', None), cov_type=cov_type, confidence=confidence
+        )
+        return pd.DataFrame({
+            'coefficient': inference['params'],
+            'std_error': inference['std_errors'],
+            't_value': inference['t_values'],
+            'p_value': inference['p_values'],
+            'ci_lower': inference['ci_lower'],
+            'ci_upper': inference['ci_upper']
+        }, index=['intercept'] + list(x_cols))
+
+    @staticmethod
+    def _reject_options(kwargs: Dict[str, Any], options: Tuple[str, ...], mode: str) -> None:
+        """Raise if options that ``mode`` does not support were passed."""
+        unsupported = [name for name in options if kwargs.get(name) not in (None, False)]
+        if unsupported:
+            raise ValueError(f"Options not supported with {mode}: {', '.join(unsupported)}")
+
+    def _process_multi_target(self, data: pd.DataFrame, x_cols: List[str], y_cols: List[str],
+                              regression_type: str, keep_data: bool = True) -> Dict[str, Any]:
+        """Fit several targets against one factorization of the features."""
+        if regression_type != "linear":
+            raise ValueError("Multiple targets are only supported for linear regression.")
+        DataValidator.validate_data(data)
+        DataValidator.validate_columns(data, x_cols + y_cols)
+
+        self.data = data if keep_data else None
+        result = regression_algos.compute_multi_target_regression(
+            data[x_cols].values, data[y_cols].values
+        )
+        result['regression_type'] = regression_type
+        result['targets'] = list(y_cols)
+
+        self.result = result
+        return self.result
+
+    def _process_grouped(self, data: pd.DataFrame, x_cols: List[str], y_col: str,
+                         regression_type: str, group_col: str, **kwargs: Any) -> Dict[str, Any]:
+        """Fit one model per value of ``group_col``."""
+        self._reject_options(kwargs, ('cov_type', 'solver', 'chunk_rows'), "group_col")
+        alpha = kwargs.get('alpha', 1.0)
+        if regression_type in ("ridge", "lasso") and (alpha is None or np.ndim(alpha) > 0):
+            raise ValueError("group_col fits one alpha per group; alpha paths are not supported.")
+        DataValidator.validate_data(data)
+        DataValidator.validate_columns(data, x_cols + [y_col, group_col])
+
+        X, y, groups = data[x_cols].values, data[y_col].values, data[group_col].values
+        result = regression_algos.compute_grouped_regression(
+            X, y, groups, regression_type=regression_type, n_jobs=kwargs.pop('n_jobs', 1), **kwargs
+        )
+        result['regression_type'] = regression_type
+        result['group_col'] = group_col
+        labels = pd.Index(result['groups'], name=group_col)
+        columns = x_cols if regression_type != 'polynomial' else None
+        result['coefficients'] = pd.DataFrame(result['coefficients'], index=labels, columns=columns)
+        result['intercept'] = pd.Series(result['intercept'], index=labels)
+        result['r2_score'] = pd.Series(result['r2_score'], index=labels)
+
+        return self._store_result(result, data, X, y, groups, **kwargs)
+
+    def _store_result(self, result: Dict[str, Any], data: pd.DataFrame, X: np.ndarray,
+                      y: np.ndarray, groups: Optional[np.ndarray] = None, lean: bool = False,
+                      keep_data: bool = True, **kwargs: Any) -> Dict[str, Any]:
+        """Store the result, making it lean and dropping the data reference if requested."""
+        if lean:
+            result = regression_algos.make_lean_result(result, X, y, groups, keep_data)
+        self.data = data if keep_data else None
+
+        self.result = result
+        return self.result
+
+    def partial_fit(self, data: pd.DataFrame, x_cols: List[str], y_col: str) -> "RegressionModule":
+        """
+        Accumulate a chunk of rows for a streaming linear regression.
+
+        Only O(p^2) sufficient statistics are kept; call finalize() to solve.
+        Accumulators of modules fed by different workers can be combined with
+        ``module.accumulator.merge(other.accumulator)``.
+
+        Args:
+            data: DataFrame chunk
+            x_cols: List of feature column names
+            y_col: Target column name
+
+        Returns:
+            Self for method chaining
+        """
+        DataValidator.validate_data(data)
+        DataValidator.validate_columns(data, x_cols + [y_col])
+
+        if self.accumulator is None:
+            self.accumulator = regression_algos.OLSAccumulator()
+            self.x_cols = list(x_cols)
+        elif list(x_cols) != self.x_cols:
+            raise ValueError(f"Expected feature columns {self.x_cols}, got {list(x_cols)}")
+
+        self.accumulator.partial_fit(data[x_cols].values, data[y_col].values)
+        return self
+
+    def finalize(self) -> Dict[str, Any]:
+        """
+        Solve the linear regression accumulated with partial_fit().
+
+        The accumulator is cleared, so a later partial_fit() starts a new fit.
+
+        Returns:
+            Dictionary with coefficients, intercept, r2_score, n_samples,
+            model and regression_type
+        """
+        if self.accumulator is None:
+            raise ValueError("No data accumulated. Call partial_fit() first.")
+
+        result = self.accumulator.finalize()
+        self.accumulator = None
+        result['regression_type'] = 'linear'
+        result['coefficients'] = dict(zip(self.x_cols, result['coefficients']))
+
         self.result = result
         return self.result
 
-    def predict(self, X: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+    def predict(self, X: Union[pd.DataFrame, np.ndarray],
+                groups: Optional[Union[pd.Series, np.ndarray]] = None) -> np.ndarray:
         """
         Make predictions with the trained model.
 
         Args:
             X: Feature data
+            groups: Group label of each row (for models fitted with group_col)
 
         Returns:
             Predictions
@@ -128,11 +297,16 @@ from ...utils.parallel import ParallelProcessor
         if isinstance(X, pd.DataFrame):
             X = X.values
 
+        if 'groups' in self.result:
+            if groups is None:
+                raise ValueError("groups is required for models fitted with group_col.")
+            return regression_algos.predict_grouped(self.result, X, groups)
+
         model = self.result['model']
 
-        # Apply transformation for polynomial regression
+        # Expand polynomial terms in chunks rather than all at once
         if self.result['regression_type'] == 'polynomial':
-            X = self.result['transformer'].transform(X)
+            return regression_algos.predict_polynomial(model, self.result['transformer'], X)
 
         return model.predict(X)
 
@@ -146,6 +320,9 @@ from ...utils.parallel import ParallelProcessor
         if not self.has_result():
             raise ValueError("No analysis performed. Call process() first.")
 
+        if 'residuals' not in self.result:
+            raise ValueError("Residuals are not available for this fit.")
+
         residuals = self.result['residuals']
 
         # Delegate computation to algorithm layer
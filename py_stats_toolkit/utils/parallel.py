@@ -23,9 +23,9 @@ class ParallelProcessor:
         else:
             self.n_jobs = max(1, n_jobs)
 
-    def parallel_map(self, func: Callable, items: List[Any]) -> List[Any]:
-        """Apply function to items in parallel."""
-        if len(items) < 100:
+    def parallel_map(self, func: Callable, items: List[Any], min_items: int = 100) -> List[Any]:
+        """Apply function to items in parallel (serially below ``min_items`` items)."""
+        if self.n_jobs == 1 or len(items) < min_items:
             return [func(item) for item in items]
 
         try:
@@ -0,0 +1,348 @@
+"""
+Tests for the correlation engines in py_stats_toolkit.algorithms.correlation.
+"""
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from py_stats_toolkit.algorithms import correlation as correlation_algos
+from py_stats_toolkit.stats.correlation import CorrelationAnalysis, RollingCorrelation
+
+
+class TestPearsonGemm(unittest.TestCase):
+    """Test the GEMM-based Pearson engine."""
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        base = rng.normal(size=(500, 1))
+        self.df = pd.DataFrame(
+            np.hstack([base + rng.normal(scale=s, size=(500, 1)) for s in (0.1, 1, 5)]),
+            columns=["a", "b", "c"],
+        )
+
+    def test_matches_pandas(self):
+        result = correlation_algos.compute_correlation_matrix(self.df)
+        np.testing.assert_allclose(result.values, self.df.corr().values, atol=1e-12)
+        self.assertListEqual(list(result.columns), ["a", "b", "c"])
+
+    def test_float32_accumulation(self):
+        result = correlation_algos.compute_correlation_matrix(self.df, dtype=np.float32)
+        np.testing.assert_allclose(result.values, self.df.corr().values, atol=1e-5)
+
+    def test_in_place_standardization(self):
+        values = self.df.to_numpy(copy=True)
+        corr = correlation_algos.compute_pearson_gemm(values, copy=False)
+        np.testing.assert_allclose(values.mean(axis=0), 0.0, atol=1e-12)
+        np.testing.assert_allclose(corr, self.df.corr().values, atol=1e-12)
+
+    def test_constant_column_and_nan_fallback(self):
+        df = self.df.assign(k=1.0)
+        result = correlation_algos.compute_correlation_matrix(df)
+        self.assertTrue(result["k"].isna().all())
+        df.iloc[0, 0] = np.nan
+        result = correlation_algos.compute_correlation_matrix(df, method="spearman")
+        np.testing.assert_allclose(result.values, df.corr(method="spearman").values, atol=1e-12)
+
+
+class TestBlockedCorrelation(unittest.TestCase):
+    """Test the tiled out-of-core correlation engine."""
+
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        self.X = rng.normal(size=(300, 11)) @ rng.normal(size=(11, 11))
+        self.expected = np.corrcoef(self.X, rowvar=False)
+
+    def test_blocks_cover_matrix(self):
+        result = correlation_algos.compute_correlation_blocked(self.X, block_size=4)
+        np.testing.assert_allclose(result, self.expected, atol=1e-12)
+
+    def test_memory_budget_limits_block_size(self):
+        blocks = list(correlation_algos.iter_correlation_blocks(self.X, memory_budget=20000))
+        self.assertTrue(all(tile.shape[0] <= 4 for _, _, _, _, tile in blocks))
+
+    def test_memory_mapped_input_and_output(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            src = os.path.join(tmp, "x.npy")
+            dst = os.path.join(tmp, "corr.npy")
+            np.save(src, self.X)
+            result = correlation_algos.compute_correlation_blocked(src, out=dst, block_size=5)
+            self.assertIsInstance(result, np.memmap)
+            del result
+            np.testing.assert_allclose(np.load(dst), self.expected, atol=1e-12)
+
+
+class TestCorrelationAccumulator(unittest.TestCase):
+    """Test the incremental co-moment accumulator."""
+
+    def setUp(self):
+        rng = np.random.default_rng(2)
+        self.X = rng.normal(loc=50, size=(400, 5)) @ rng.normal(size=(5, 5))
+
+    def test_updates_match_full_computation(self):
+        acc = correlation_algos.CorrelationAccumulator()
+        for chunk in np.array_split(self.X, 7):
+            acc.update(chunk)
+        self.assertEqual(acc.count, 400)
+        np.testing.assert_allclose(acc.correlation(), np.corrcoef(self.X, rowvar=False), atol=1e-12)
+        np.testing.assert_allclose(acc.covariance(), np.cov(self.X, rowvar=False), rtol=1e-10)
+
+    def test_merge(self):
+        left = correlation_algos.CorrelationAccumulator().update(self.X[:150])
+        right = correlation_algos.CorrelationAccumulator().update(self.X[150:])
+        right_comoment = right.comoment.copy()
+        left.merge(right)
+        np.testing.assert_allclose(left.correlation(), np.corrcoef(self.X, rowvar=False), atol=1e-12)
+        np.testing.assert_array_equal(right.comoment, right_comoment)
+        right.update(self.X[:10])
+        np.testing.assert_allclose(left.covariance(), np.cov(self.X, rowvar=False), rtol=1e-10)
+
+    def test_feature_mismatch(self):
+        acc = correlation_algos.CorrelationAccumulator().update(self.X)
+        with self.assertRaises(ValueError):
+            acc.update(self.X[:, :3])
+
+
+class TestSpearman(unittest.TestCase):
+    """Test the rank-once Spearman engine."""
+
+    def setUp(self):
+        rng = np.random.default_rng(3)
+        self.df = pd.DataFrame(rng.integers(0, 8, size=(200, 4)), columns=list("abcd"))
+        self.df["e"] = np.exp(self.df["a"] + rng.normal(size=200))
+
+    def test_matrix_matches_pandas_with_ties(self):
+        result = correlation_algos.compute_correlation_matrix(self.df, method="spearman")
+        np.testing.assert_allclose(result.values, self.df.corr(method="spearman").values, atol=1e-12)
+
+    def test_parallel_ranking(self):
+        ranks = correlation_algos.rank_columns(self.df.values, n_jobs=2)
+        np.testing.assert_allclose(ranks, self.df.rank().values)
+
+    def test_bivariate_matches_scipy(self):
+        rho, p_value = correlation_algos.compute_correlation_test(
+            self.df["a"].values, self.df["e"].values, method="spearman"
+        )
+        expected = stats.spearmanr(self.df["a"], self.df["e"])
+        self.assertAlmostEqual(rho, expected[0], places=12)
+        self.assertAlmostEqual(p_value, expected[1], places=12)
+
+
+class TestKendall(unittest.TestCase):
+    """Test the merge-sort Kendall tau-b engine."""
+
+    def setUp(self):
+        rng = np.random.default_rng(4)
+        self.df = pd.DataFrame(rng.integers(0, 5, size=(300, 3)).astype(float), columns=list("abc"))
+        self.df["d"] = rng.normal(size=300)
+        self.df["e"] = 2 * self.df["d"] + rng.normal(size=300)
+
+    def test_sum_smaller_before_matches_brute_force(self):
+        rng = np.random.default_rng(5)
+        ranks = rng.integers(0, 10, size=50)
+        weights = rng.random(50)
+        expected = [weights[:i][ranks[:i] < ranks[i]].sum() for i in range(50)]
+        np.testing.assert_allclose(correlation_algos._sum_smaller_before(ranks, weights), expected)
+
+    def test_matrix_matches_pandas_with_ties(self):
+        result = correlation_algos.compute_correlation_matrix(self.df, method="kendall")
+        np.testing.assert_allclose(result.values, self.df.corr(method="kendall").values, atol=1e-12)
+
+    def test_parallel_rows(self):
+        serial = correlation_algos.compute_kendall_matrix(self.df.values)
+        parallel = correlation_algos.compute_kendall_matrix(self.df.values, n_jobs=2)
+        np.testing.assert_allclose(serial, parallel)
+
+
+class TestCorrelatedPairs(unittest.TestCase):
+    """Test the blocked top-k / threshold pair finder."""
+
+    def setUp(self):
+        rng = np.random.default_rng(6)
+        self.X = rng.normal(size=(200, 3)) @ rng.normal(size=(3, 13))
+        self.corr = np.corrcoef(self.X, rowvar=False)
+        i, j = np.triu_indices(13, k=1)
+        self.expected = sorted(zip(i, j, self.corr[i, j]), key=lambda p: -abs(p[2]))
+
+    def test_top_k(self):
+        pairs = correlation_algos.find_correlated_pairs(self.X, top_k=5, block_size=4)
+        self.assertEqual(pairs.dtype, correlation_algos.PAIR_DTYPE)
+        self.assertEqual([(p[0], p[1]) for p in self.expected[:5]], list(zip(pairs["i"], pairs["j"])))
+        np.testing.assert_allclose(pairs["r"], [p[2] for p in self.expected[:5]], atol=1e-12)
+
+    def test_threshold(self):
+        pairs = correlation_algos.find_correlated_pairs(self.X, threshold=0.6, block_size=3)
+        expected = [p for p in self.expected if abs(p[2]) >= 0.6]
+        self.assertEqual(len(pairs), len(expected))
+        self.assertTrue(np.all(pairs["i"] < pairs["j"]))
+
+    def test_pairwise_correlations_keep_labels(self):
+        df = pd.DataFrame(self.X, columns=[f"v{k}" for k in range(13)])
+        pairs = correlation_algos.compute_pairwise_correlations(df, threshold=0.6)
+        self.assertEqual(pairs[0][:2], (f"v{self.expected[0][0]}", f"v{self.expected[0][1]}"))
+
+
+class TestCorrelationPValues(unittest.TestCase):
+    """Test the vectorized p-value and confidence interval matrices."""
+
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        self.df = pd.DataFrame(rng.normal(size=(60, 4)), columns=list("abcd"))
+        self.df["e"] = self.df["a"] + rng.normal(size=60)
+        self.df.iloc[:5, 1] = np.nan
+
+    def test_matches_scipy_pairwise(self):
+        result = correlation_algos.compute_correlation_matrix_test(self.df)
+        complete = self.df[["b", "e"]].dropna()
+        expected = stats.pearsonr(complete["b"], complete["e"])
+        self.assertEqual(result["n"].loc["b", "e"], 55)
+        self.assertAlmostEqual(result["p_values"].loc["b", "e"], expected[1], places=10)
+        ci = expected.confidence_interval(0.95)
+        self.assertAlmostEqual(result["ci_lower"].loc["b", "e"], ci.low, places=10)
+        self.assertAlmostEqual(result["ci_upper"].loc["b", "e"], ci.high, places=10)
+
+    def test_bonferroni_adjustment(self):
+        raw = correlation_algos.compute_correlation_matrix_test(self.df)["p_values"]
+        adjusted = correlation_algos.compute_correlation_matrix_test(self.df, adjust="bonferroni")["p_values"]
+        self.assertAlmostEqual(adjusted.loc["a", "c"], min(1.0, raw.loc["a", "c"] * 10), places=12)
+        self.assertAlmostEqual(adjusted.loc["c", "a"], adjusted.loc["a", "c"])
+
+
+class TestPairwiseComplete(unittest.TestCase):
+    """Test the masked pairwise-complete Pearson engine."""
+
+    def setUp(self):
+        rng = np.random.default_rng(8)
+        values = rng.normal(loc=1e3, size=(400, 6)) @ rng.normal(size=(6, 6))
+        values[rng.random(values.shape) < 0.15] = np.nan
+        self.df = pd.DataFrame(values)
+
+    def test_matches_pandas(self):
+        result = correlation_algos.compute_correlation_matrix(self.df)
+        np.testing.assert_allclose(result.values, self.df.corr().values, atol=1e-10)
+
+    def test_min_periods(self):
+        df = self.df.copy()
+        df.iloc[3:, 0] = np.nan
+        corr = correlation_algos.compute_pearson_pairwise_complete(df.values, min_periods=10)
+        self.assertTrue(np.isnan(corr[0, 1:]).all())
+
+
+class TestRollingCorrelation(unittest.TestCase):
+    """Test sliding-sum rolling correlation and covariance."""
+
+    def setUp(self):
+        rng = np.random.default_rng(9)
+        self.x = rng.normal(size=300) + 100
+        self.Y = rng.normal(size=(300, 3))
+        self.Y[:, 0] += self.x
+        self.Y[40, 1] = np.nan
+
+    def test_one_vs_many_matches_pandas(self):
+        result = correlation_algos.compute_rolling_correlation(self.x, self.Y, 30)
+        x = pd.Series(self.x)
+        expected = np.column_stack([x.rolling(30).corr(pd.Series(col)).values for col in self.Y.T])
+        np.testing.assert_allclose(result, expected, atol=1e-10)
+
+    def test_covariance_matches_pandas(self):
+        result = correlation_algos.compute_rolling_covariance(self.x, self.Y[:, 0], 30, min_periods=10)
+        expected = pd.Series(self.x).rolling(30, min_periods=10).cov(pd.Series(self.Y[:, 0]))
+        np.testing.assert_allclose(result, expected.values, atol=1e-10)
+
+    def test_long_drifting_series(self):
+        rng = np.random.default_rng(10)
+        n = 2_000_000
+        x = np.cumsum(rng.normal(size=n)) * 50 + 1e6
+        y = 0.5 * x + 1000 * rng.normal(size=n)
+        result = correlation_algos.compute_rolling_correlation(x, y, 100)
+        positions = rng.integers(100, n, 200)
+        exact = [np.corrcoef(x[i - 99:i + 1], y[i - 99:i + 1])[0, 1] for i in positions]
+        np.testing.assert_allclose(result[positions], exact, atol=1e-8)
+
+    def test_streaming_matches_batch(self):
+        stream = RollingCorrelation(25)
+        streamed = np.array([stream.update(a, b) for a, b in zip(self.x, self.Y)])
+        batch = RollingCorrelation(25).analyze(self.x, pd.DataFrame(self.Y))["correlation"]
+        np.testing.assert_allclose(streamed, batch.values, atol=1e-10)
+
+
+class TestCorrelationWithTarget(unittest.TestCase):
+    """Test the one-vs-many fast path."""
+
+    def setUp(self):
+        rng = np.random.default_rng(10)
+        self.y = rng.normal(size=80)
+        self.df = pd.DataFrame(rng.normal(size=(80, 5)), columns=list("abcde"))
+        self.df["a"] += self.y
+
+    def test_pearson_matches_scipy(self):
+        result = CorrelationAnalysis("pearson").analyze(self.df, self.y)
+        for col in self.df.columns:
+            expected = stats.pearsonr(self.df[col], self.y)
+            self.assertAlmostEqual(result["correlation"][col], expected[0], places=12)
+            self.assertAlmostEqual(result["p_value"][col], expected[1], places=10)
+
+    def test_spearman_matches_scipy(self):
+        result = correlation_algos.compute_correlation_with_target(self.df.values, self.y, "spearman")
+        expected = [stats.spearmanr(self.df[col], self.y) for col in self.df.columns]
+        np.testing.assert_allclose(result["correlation"], [e[0] for e in expected], atol=1e-12)
+        np.testing.assert_allclose(result["p_value"], [e[1] for e in expected], atol=1e-10)
+
+
+class TestCrossCorrelation(unittest.TestCase):
+    """Test the FFT-based lagged cross-correlation."""
+
+    def setUp(self):
+        rng = np.random.default_rng(13)
+        self.x = rng.normal(size=400)
+        self.Y = rng.normal(size=(400, 2))
+        self.Y[3:, 0] += self.x[:-3]
+
+    def test_matches_direct_sums(self):
+        result = correlation_algos.compute_cross_correlation(self.x, self.Y[:, 0], max_lag=5)
+        zx = (self.x - self.x.mean()) / self.x.std()
+        zy = (self.Y[:, 0] - self.Y[:, 0].mean()) / self.Y[:, 0].std()
+        expected = [
+            np.sum(zx[:400 - k] * zy[k:]) / 400 if k >= 0 else np.sum(zx[-k:] * zy[:400 + k]) / 400
+            for k in range(-5, 6)
+        ]
+        np.testing.assert_allclose(result["ccf"], expected, atol=1e-12)
+        self.assertEqual(result["lags"][np.argmax(result["ccf"])], 3)
+
+    def test_one_vs_many(self):
+        result = correlation_algos.compute_cross_correlation(self.x, self.Y, max_lag=4)
+        self.assertEqual(result["ccf"].shape, (9, 2))
+        single = correlation_algos.compute_cross_correlation(self.x, self.Y[:, 1], max_lag=4)
+        np.testing.assert_allclose(result["ccf"][:, 1], single["ccf"], atol=1e-12)
+        self.assertAlmostEqual(result["confidence_band"], 1.959964 / 20, places=6)
+
+
+class TestPartialCorrelation(unittest.TestCase):
+    """Test partial correlations from the precision matrix."""
+
+    def setUp(self):
+        rng = np.random.default_rng(14)
+        z = rng.normal(size=500)
+        self.X = np.column_stack([z + rng.normal(size=500), z + rng.normal(size=500), z])
+
+    def test_matches_residual_regression(self):
+        partial = correlation_algos.compute_partial_correlation(np.cov(self.X, rowvar=False))
+        z = np.column_stack([np.ones(500), self.X[:, 2]])
+        res = [self.X[:, k] - z @ np.linalg.lstsq(z, self.X[:, k], rcond=None)[0] for k in (0, 1)]
+        self.assertAlmostEqual(partial[0, 1], np.corrcoef(res[0], res[1])[0, 1], places=10)
+        self.assertAlmostEqual(partial[0, 1], partial[1, 0])
+
+    def test_singular_requires_shrinkage(self):
+        cov = np.cov(np.random.default_rng(15).normal(size=(5, 20)), rowvar=False)
+        with self.assertRaises(ValueError):
+            correlation_algos.compute_partial_correlation(cov)
+        partial = correlation_algos.compute_partial_correlation(cov, shrinkage=0.1)
+        self.assertTrue(np.all(np.isfinite(partial)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+"""
+Tests for the shrinkage estimators in py_stats_toolkit.algorithms.covariance.
+"""
+
+import unittest
+
+import numpy as np
+from sklearn.covariance import ledoit_wolf, oas
+
+from py_stats_toolkit.algorithms import covariance as covariance_algos
+
+
+class TestShrinkageCovariance(unittest.TestCase):
+    """Test streaming Ledoit-Wolf and OAS estimators."""
+
+    def setUp(self):
+        rng = np.random.default_rng(16)
+        self.X = rng.normal(loc=500, size=(60, 40)) @ rng.normal(size=(40, 40)) * 0.1
+
+    def test_ledoit_wolf_matches_sklearn(self):
+        result = covariance_algos.compute_shrinkage_covariance(self.X, "ledoit_wolf", chunk_rows=7)
+        expected_cov, expected_shrinkage = ledoit_wolf(self.X)
+        self.assertAlmostEqual(result["shrinkage"], expected_shrinkage, places=10)
+        np.testing.assert_allclose(result["covariance"], expected_cov, rtol=1e-9, atol=1e-9)
+
+    def test_oas_matches_sklearn(self):
+        result = covariance_algos.compute_shrinkage_covariance(self.X, "oas", chunk_rows=11)
+        expected_cov, expected_shrinkage = oas(self.X)
+        self.assertAlmostEqual(result["shrinkage"], expected_shrinkage, places=10)
+        np.testing.assert_allclose(result["covariance"], expected_cov, rtol=1e-9, atol=1e-9)
+
+    def test_iterable_of_chunks(self):
+        chunks = iter(np.array_split(self.X, 4))
+        result = covariance_algos.compute_shrinkage_covariance(chunks)
+        self.assertEqual(result["n"], 60)
+        np.testing.assert_allclose(np.diagonal(result["correlation"]), 1.0)
+        self.assertGreater(np.linalg.eigvalsh(result["correlation"]).min(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
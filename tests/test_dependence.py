@@ -0,0 +1,61 @@
+"""
+Tests for the dependence measures in py_stats_toolkit.algorithms.dependence.
+"""
+
+import unittest
+
+import numpy as np
+
+from py_stats_toolkit.algorithms import dependence as dependence_algos
+
+
+def naive_distance_correlation(x, y):
+    """Reference O(n^2) distance correlation from double-centered matrices."""
+    a = np.abs(x[:, None] - x[None, :])
+    b = np.abs(y[:, None] - y[None, :])
+    A = a - a.mean(axis=0) - a.mean(axis=1)[:, None] + a.mean()
+    B = b - b.mean(axis=0) - b.mean(axis=1)[:, None] + b.mean()
+    return np.sqrt((A * B).mean() / np.sqrt((A * A).mean() * (B * B).mean()))
+
+
+class TestMutualInformation(unittest.TestCase):
+    """Test quantile-binned mutual information."""
+
+    def setUp(self):
+        rng = np.random.default_rng(17)
+        self.X = rng.normal(size=(2000, 3))
+        self.X[:, 1] = self.X[:, 0] ** 2 + 0.1 * rng.normal(size=2000)
+
+    def test_detects_nonlinear_dependence(self):
+        mi = dependence_algos.compute_mutual_information_matrix(self.X, n_bins=10, normalized=True)
+        self.assertGreater(mi[0, 1], 0.3)
+        self.assertLess(mi[0, 2], 0.05)
+        np.testing.assert_allclose(mi, mi.T)
+
+    def test_entropy_on_diagonal(self):
+        mi = dependence_algos.compute_mutual_information_matrix(self.X, n_bins=8, n_jobs=2)
+        np.testing.assert_allclose(np.diagonal(mi), np.log(8), atol=1e-3)
+
+
+class TestDistanceCorrelation(unittest.TestCase):
+    """Test the O(n log n) distance correlation."""
+
+    def test_matches_naive_with_ties(self):
+        rng = np.random.default_rng(18)
+        x = rng.integers(0, 6, size=80).astype(float)
+        y = x ** 2 + rng.normal(size=80)
+        self.assertAlmostEqual(
+            dependence_algos.compute_distance_correlation(x, y), naive_distance_correlation(x, y), places=10
+        )
+
+    def test_matrix(self):
+        rng = np.random.default_rng(19)
+        X = rng.normal(size=(100, 3))
+        X[:, 2] = np.cos(X[:, 0])
+        dcor = dependence_algos.compute_distance_correlation_matrix(X)
+        self.assertAlmostEqual(dcor[0, 2], naive_distance_correlation(X[:, 0], X[:, 2]), places=10)
+        np.testing.assert_allclose(np.diagonal(dcor), 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
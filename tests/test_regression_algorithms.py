@@ -0,0 +1,330 @@
+"""
+Tests for the native solvers in py_stats_toolkit.algorithms.regression.
+"""
+
+import unittest
+
+import numpy as np
+
+from py_stats_toolkit.algorithms import regression as regression_algos
+
+
+class TestNativeLinearRegression(unittest.TestCase):
+    """Test the Cholesky and QR OLS solvers against scikit-learn."""
+
+    def setUp(self):
+        rng = np.random.default_rng(20)
+        self.X = rng.normal(loc=10, size=(300, 4))
+        self.y = self.X @ np.array([1.0, -2.0, 0.5, 3.0]) + 4.0 + rng.normal(size=300)
+        self.reference = regression_algos.compute_linear_regression(self.X, self.y)
+
+    def test_solvers_match_sklearn(self):
+        for solver in ("cholesky", "qr"):
+            result = regression_algos.compute_linear_regression(
+                self.X, self.y, solver=solver, chunk_rows=64
+            )
+            np.testing.assert_allclose(result["coefficients"], self.reference["coefficients"], atol=1e-10)
+            self.assertAlmostEqual(result["intercept"], self.reference["intercept"], places=8)
+            self.assertAlmostEqual(result["r2_score"], self.reference["r2_score"], places=12)
+            np.testing.assert_allclose(result["residuals"], self.reference["residuals"], atol=1e-8)
+
+    def test_cached_factor(self):
+        result = regression_algos.compute_linear_regression(self.X, self.y, solver="cholesky")
+        r_factor = result["model"].r_factor
+        centered = self.X - self.X.mean(axis=0)
+        np.testing.assert_allclose(r_factor.T @ r_factor, centered.T @ centered, rtol=1e-10)
+
+    def test_collinear_design_falls_back(self):
+        X = np.column_stack([self.X, self.X[:, 0]])
+        result = regression_algos.compute_linear_regression(X, self.y, solver="cholesky")
+        self.assertIsNone(result["model"].r_factor)
+        self.assertAlmostEqual(result["r2_score"], self.reference["r2_score"], places=8)
+
+    def test_two_dimensional_target(self):
+        column = regression_algos.compute_linear_regression(self.X, self.y[:, None])
+        self.assertAlmostEqual(column["r2_score"], self.reference["r2_score"], places=12)
+        self.assertEqual(column["residuals"].shape, (300, 1))
+
+        Y = np.column_stack([self.y, self.X[:, 0] - self.y])
+        result = regression_algos.compute_linear_regression(self.X, Y)
+        self.assertAlmostEqual(result["r2_score"], result["model"].score(self.X, Y), places=12)
+
+
+class TestOLSAccumulator(unittest.TestCase):
+    """Test streaming OLS with partial_fit / merge / finalize."""
+
+    def setUp(self):
+        rng = np.random.default_rng(21)
+        self.X = rng.normal(loc=5, size=(400, 3))
+        self.y = self.X @ np.array([2.0, 0.0, -1.0]) + 1.0 + rng.normal(size=400)
+        self.reference = regression_algos.compute_linear_regression(self.X, self.y)
+
+    def test_chunks_match_full_fit(self):
+        accumulator = regression_algos.OLSAccumulator()
+        for X_chunk, y_chunk in zip(np.array_split(self.X, 9), np.array_split(self.y, 9)):
+            accumulator.partial_fit(X_chunk, y_chunk)
+        result = accumulator.finalize()
+        np.testing.assert_allclose(result["coefficients"], self.reference["coefficients"], atol=1e-10)
+        self.assertAlmostEqual(result["r2_score"], self.reference["r2_score"], places=10)
+        self.assertEqual(result["n_samples"], 400)
+
+    def test_merge_workers(self):
+        left = regression_algos.OLSAccumulator().partial_fit(self.X[:100], self.y[:100])
+        right = regression_algos.OLSAccumulator().partial_fit(self.X[100:], self.y[100:])
+        result = left.merge(right).finalize()
+        self.assertAlmostEqual(result["intercept"], self.reference["intercept"], places=8)
+
+    def test_linear_regression_partial_fit(self):
+        from py_stats_toolkit.stats.regression import LinearRegression
+
+        model = LinearRegression()
+        for X_chunk, y_chunk in zip(np.array_split(self.X, 4), np.array_split(self.y, 4)):
+            model.partial_fit(X_chunk, y_chunk)
+        model.finalize()
+        np.testing.assert_allclose(model.predict(self.X), self.reference["predictions"], atol=1e-8)
+
+    def test_linear_regression_refit_after_finalize(self):
+        from py_stats_toolkit.stats.regression import LinearRegression
+
+        model = LinearRegression().partial_fit(self.X[:50], self.y[:50]).finalize()
+        model.fit(self.X, self.y)
+        np.testing.assert_allclose(model.coef_, self.reference["coefficients"])
+
+        model.partial_fit(self.X[200:], self.y[200:]).finalize()
+        model.partial_fit(self.X, self.y).finalize()
+        np.testing.assert_allclose(model.coef_, self.reference["coefficients"], atol=1e-10)
+
+
+class TestMultiTargetRegression(unittest.TestCase):
+    """Test the shared-factorization multi-target solver."""
+
+    def test_matches_per_target_fits(self):
+        rng = np.random.default_rng(22)
+        X = rng.normal(size=(250, 3))
+        Y = X @ rng.normal(size=(3, 6)) + rng.normal(size=(250, 6))
+        result = regression_algos.compute_multi_target_regression(X, Y)
+
+        self.assertEqual(result["coefficients"].shape, (6, 3))
+        for j in range(Y.shape[1]):
+            reference = regression_algos.compute_linear_regression(X, Y[:, j])
+            np.testing.assert_allclose(result["coefficients"][j], reference["coefficients"], atol=1e-10)
+            self.assertAlmostEqual(result["intercept"][j], reference["intercept"], places=10)
+            self.assertAlmostEqual(result["r2_score"][j], reference["r2_score"], places=10)
+        self.assertEqual(result["model"].predict(X[:5]).shape, (5, 6))
+
+    def test_offset_targets(self):
+        from sklearn.linear_model import LinearRegression
+
+        rng = np.random.default_rng(29)
+        X = rng.normal(size=(300, 3))
+        Y = X @ rng.normal(size=(3, 2)) + rng.normal(size=(300, 2)) + np.array([1e7, 1e9])
+        result = regression_algos.compute_multi_target_regression(X, Y)
+        for j in range(Y.shape[1]):
+            reference = LinearRegression().fit(X, Y[:, j])
+            np.testing.assert_allclose(result["coefficients"][j], reference.coef_, atol=1e-6)
+            self.assertAlmostEqual(result["r2_score"][j], reference.score(X, Y[:, j]), places=6)
+
+
+class TestRidgePath(unittest.TestCase):
+    """Test the SVD ridge path against scikit-learn."""
+
+    def setUp(self):
+        rng = np.random.default_rng(23)
+        self.X = rng.normal(loc=3, size=(120, 5))
+        self.y = self.X @ rng.normal(size=5) + 2.0 + rng.normal(size=120)
+        self.alphas = np.logspace(-2, 3, 12)
+
+    def test_path_matches_ridge(self):
+        result = regression_algos.compute_ridge_path(self.X, self.y, self.alphas)
+        self.assertEqual(result["coefficient_path"].shape, (12, 5))
+        for k in (0, 6, 11):
+            reference = regression_algos.compute_ridge_regression(self.X, self.y, self.alphas[k])
+            np.testing.assert_allclose(result["coefficient_path"][k], reference["coefficients"], atol=1e-8)
+            self.assertAlmostEqual(result["intercept_path"][k], reference["intercept"], places=8)
+
+    def test_loo_matches_refits(self):
+        result = regression_algos.compute_ridge_path(self.X, self.y, self.alphas[[3]])
+        errors = []
+        for i in range(len(self.y)):
+            mask = np.arange(len(self.y)) != i
+            fit = regression_algos.compute_ridge_regression(self.X[mask], self.y[mask], self.alphas[3])
+            errors.append(self.y[i] - fit["model"].predict(self.X[i:i + 1])[0])
+        self.assertAlmostEqual(result["loo_mse"][0], np.mean(np.square(errors)), places=8)
+        self.assertEqual(result["best_alpha"], self.alphas[3])
+
+
+class TestLassoPath(unittest.TestCase):
+    """Test the screened, warm-started lasso path against scikit-learn."""
+
+    def setUp(self):
+        rng = np.random.default_rng(24)
+        self.X = rng.normal(loc=1, size=(80, 40))
+        beta = np.zeros(40)
+        beta[:4] = [3.0, -2.0, 1.5, 1.0]
+        self.y = self.X @ beta + 0.5 + rng.normal(size=80)
+
+    def check_against_sklearn(self, X, l1_ratio):
+        from sklearn.linear_model import ElasticNet
+
+        result = regression_algos.compute_lasso_path(
+            X, self.y, n_alphas=20, l1_ratio=l1_ratio, tol=1e-10, max_iter=10000
+        )
+        for k in (2, 10, 19):
+            reference = ElasticNet(alpha=result["alphas"][k], l1_ratio=l1_ratio,
+                                   tol=1e-10, max_iter=10000).fit(X, self.y)
+            np.testing.assert_allclose(result["coefficient_path"][k], reference.coef_, atol=1e-6)
+            self.assertAlmostEqual(result["intercept_path"][k], reference.intercept_, places=6)
+        self.assertTrue(np.all(result["coefficient_path"][0] == 0))
+        return result
+
+    def test_gram_path(self):
+        result = self.check_against_sklearn(self.X, 1.0)
+        self.assertLess(result["n_screened"][5], self.X.shape[1])
+
+    def test_criterion_selection(self):
+        for precompute in (True, False):
+            result = regression_algos.compute_lasso_path(self.X, self.y, n_alphas=30,
+                                                         precompute=precompute)
+            residuals = self.y[:, None] - self.X @ result["coefficient_path"].T - result["intercept_path"]
+            np.testing.assert_allclose(result["rss"], np.sum(residuals ** 2, axis=0), rtol=1e-8)
+            best = result["best_index"]
+            self.assertEqual(result["alpha"], result["alphas"][best])
+            np.testing.assert_allclose(result["coefficients"], result["coefficient_path"][best])
+            self.assertLess(result["n_active"][best], 40)
+
+        last = regression_algos.compute_lasso_path(self.X, self.y, n_alphas=30, criterion="min_alpha")
+        self.assertEqual(last["best_index"], 29)
+
+    def test_wide_elastic_net_path(self):
+        X = np.hstack([self.X, self.X[:, ::-1] + 0.1])
+        self.check_against_sklearn(X, 0.5)
+
+
+class TestGroupedRegression(unittest.TestCase):
+    """Test per-group regressions against separate fits."""
+
+    def setUp(self):
+        rng = np.random.default_rng(25)
+        self.groups = rng.choice(["a", "b", "c", "d"], size=400)
+        self.X = rng.normal(size=(400, 2))
+        slopes = {"a": 1.0, "b": -1.0, "c": 2.0, "d": 0.0}
+        self.y = np.array([slopes[g] for g in self.groups]) * self.X[:, 0] + rng.normal(size=400)
+
+    def test_linear_matches_separate_fits(self):
+        result = regression_algos.compute_grouped_regression(self.X, self.y, self.groups)
+        np.testing.assert_array_equal(result["groups"], ["a", "b", "c", "d"])
+        for k, label in enumerate(result["groups"]):
+            rows = self.groups == label
+            reference = regression_algos.compute_linear_regression(self.X[rows], self.y[rows])
+            np.testing.assert_allclose(result["coefficients"][k], reference["coefficients"], atol=1e-10)
+            self.assertAlmostEqual(result["intercept"][k], reference["intercept"], places=10)
+            self.assertAlmostEqual(result["r2_score"][k], reference["r2_score"], places=10)
+            np.testing.assert_allclose(result["predictions"][rows], reference["predictions"], atol=1e-10)
+        np.testing.assert_allclose(
+            regression_algos.predict_grouped(result, self.X, self.groups), result["predictions"]
+        )
+
+    def test_sklearn_types_per_group(self):
+        result = regression_algos.compute_grouped_regression(
+            self.X, self.y, self.groups, regression_type="ridge", alpha=2.0
+        )
+        rows = self.groups == "c"
+        reference = regression_algos.compute_ridge_regression(self.X[rows], self.y[rows], alpha=2.0)
+        np.testing.assert_allclose(result["coefficients"][2], reference["coefficients"])
+        np.testing.assert_allclose(result["predictions"][rows], reference["predictions"])
+        np.testing.assert_allclose(
+            regression_algos.predict_grouped(result, self.X, self.groups), result["predictions"]
+        )
+        subset = np.flatnonzero(self.groups != "b")[::-1]
+        np.testing.assert_allclose(
+            regression_algos.predict_grouped(result, self.X[subset], self.groups[subset]),
+            result["predictions"][subset]
+        )
+
+
+class TestChunkedPolynomialRegression(unittest.TestCase):
+    """Test the chunked polynomial Gram accumulation."""
+
+    def test_matches_full_expansion(self):
+        rng = np.random.default_rng(26)
+        X = rng.normal(size=(500, 3))
+        y = 1.0 + X[:, 0] ** 2 - X[:, 1] * X[:, 2] + 0.1 * rng.normal(size=500)
+        reference = regression_algos.compute_polynomial_regression(X, y, degree=3)
+        result = regression_algos.compute_polynomial_regression(X, y, degree=3, chunk_rows=70)
+
+        np.testing.assert_allclose(result["coefficients"], reference["coefficients"], atol=1e-8)
+        self.assertAlmostEqual(result["intercept"], reference["intercept"], places=8)
+        self.assertAlmostEqual(result["r2_score"], reference["r2_score"], places=10)
+        np.testing.assert_allclose(result["predictions"], reference["predictions"], atol=1e-8)
+        np.testing.assert_allclose(
+            regression_algos.predict_polynomial(result["model"], result["transformer"], X, 33),
+            reference["predictions"], atol=1e-8
+        )
+
+
+class TestLazyRegressionResult(unittest.TestCase):
+    """Test lean results with lazily computed predictions."""
+
+    def setUp(self):
+        rng = np.random.default_rng(27)
+        self.X = rng.normal(size=(230, 2))
+        self.y = self.X @ np.array([1.0, 2.0]) + rng.normal(size=230)
+
+    def test_lazy_predictions_match_eager(self):
+        for fit in (regression_algos.compute_linear_regression,
+                    regression_algos.compute_polynomial_regression):
+            eager = fit(self.X, self.y)
+            lean = regression_algos.make_lean_result(dict(eager), self.X, self.y, chunk_rows=50)
+            self.assertNotIn("predictions", lean._values)
+            self.assertIn("residuals", lean)
+            np.testing.assert_allclose(lean["predictions"], eager["predictions"])
+            np.testing.assert_allclose(np.concatenate(list(lean.iter_residuals())), eager["residuals"])
+            self.assertEqual(lean["r2_score"], eager["r2_score"])
+
+    def test_release_data(self):
+        eager = regression_algos.compute_linear_regression(self.X, self.y)
+        lean = regression_algos.make_lean_result(eager, self.X, self.y)
+        lean.release_data()
+        self.assertNotIn("residuals", lean)
+        self.assertEqual(set(lean), set(eager) - {"predictions", "residuals"})
+        with self.assertRaises(KeyError):
+            lean["predictions"]
+
+        dropped = regression_algos.make_lean_result(eager, self.X, self.y, keep_data=False)
+        self.assertFalse(dropped.has_data)
+
+
+class TestCoefficientInference(unittest.TestCase):
+    """Test coefficient inference against statsmodels."""
+
+    def test_matches_statsmodels(self):
+        import statsmodels.api as sm
+
+        rng = np.random.default_rng(28)
+        X = rng.normal(loc=3, size=(200, 3))
+        y = X @ np.array([1.0, 2.0, 0.0]) + rng.normal(size=200) * (1 + np.abs(X[:, 0]))
+        for solver in ("sklearn", "cholesky"):
+            result = regression_algos.compute_linear_regression(X, y, solver=solver)
+            r_factor = getattr(result["model"], "r_factor", None)
+            for cov_type in regression_algos.COV_TYPES:
+                inference = regression_algos.compute_coefficient_inference(
+                    X, result["residuals"], result["coefficients"], result["intercept"],
+                    r_factor, cov_type=cov_type
+                )
+                reference = sm.OLS(y, sm.add_constant(X)).fit(cov_type=cov_type)
+                np.testing.assert_allclose(inference["std_errors"], reference.bse, rtol=1e-10)
+                np.testing.assert_allclose(inference["p_values"], reference.pvalues, atol=1e-12)
+                np.testing.assert_allclose(
+                    np.column_stack([inference["ci_lower"], inference["ci_upper"]]),
+                    reference.conf_int(), rtol=1e-10
+                )
+
+    def test_unknown_cov_type(self):
+        with self.assertRaises(ValueError):
+            regression_algos.compute_coefficient_inference(
+                np.ones((5, 1)), np.zeros(5), np.zeros(1), 0.0, cov_type="HC9"
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
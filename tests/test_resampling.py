@@ -0,0 +1,104 @@
+"""
+Tests for the resampling algorithms in py_stats_toolkit.algorithms.resampling.
+"""
+
+import unittest
+
+import numpy as np
+
+from py_stats_toolkit.algorithms import resampling as resampling_algos
+
+
+class TestBootstrapCorrelation(unittest.TestCase):
+    """Test batched bootstrap confidence intervals."""
+
+    def setUp(self):
+        rng = np.random.default_rng(11)
+        self.x = rng.normal(size=200)
+        self.y = self.x + rng.normal(size=200)
+
+    def test_pair_interval_matches_naive_bootstrap(self):
+        result = resampling_algos.bootstrap_correlation(
+            self.x, self.y, n_resamples=300, random_state=0, batch_size=64
+        )
+        # Rebuild the same resamples and correlate them one by one
+        replicates = []
+        for seed, size in zip(np.random.SeedSequence(0).spawn(5), [64, 64, 64, 64, 44]):
+            rng = np.random.default_rng(seed)
+            for idx in rng.integers(0, 200, size=(size, 200)):
+                replicates.append(np.corrcoef(self.x[idx], self.y[idx])[0, 1])
+        np.testing.assert_allclose(result["replicates"], replicates, atol=1e-12)
+        self.assertLess(result["ci_lower"], result["correlation"])
+        self.assertGreater(result["ci_upper"], result["correlation"])
+
+    def test_reproducible_across_workers(self):
+        serial = resampling_algos.bootstrap_correlation(
+            self.x, self.y, n_resamples=200, random_state=3, batch_size=50
+        )
+        parallel = resampling_algos.bootstrap_correlation(
+            self.x, self.y, n_resamples=200, random_state=3, batch_size=50, n_jobs=2
+        )
+        np.testing.assert_allclose(serial["replicates"], parallel["replicates"])
+
+    def test_matrix_intervals(self):
+        X = np.column_stack([self.x, self.y, self.y ** 2])
+        result = resampling_algos.bootstrap_correlation(X, n_resamples=200, random_state=1)
+        self.assertEqual(result["ci_lower"].shape, (3, 3))
+        self.assertTrue(np.all(result["ci_lower"] <= result["ci_upper"]))
+        np.testing.assert_allclose(result["correlation"], np.corrcoef(X, rowvar=False), atol=1e-12)
+
+
+class TestPermutationCorrelationTest(unittest.TestCase):
+    """Test the block permutation engine."""
+
+    def setUp(self):
+        rng = np.random.default_rng(12)
+        self.x = rng.normal(size=25)
+        self.y = 0.3 * self.x + rng.normal(size=25)
+
+    def test_matches_scipy_permutation_test(self):
+        from scipy import stats
+
+        result = resampling_algos.permutation_correlation_test(
+            self.x, self.y, n_permutations=4000, random_state=0
+        )
+        expected = stats.pearsonr(self.x, self.y)
+        self.assertAlmostEqual(result["correlation"], expected[0], places=12)
+        self.assertAlmostEqual(result["p_value"], expected[1], delta=0.03)
+        self.assertFalse(result["early_stopped"])
+
+    def test_early_stop(self):
+        y = self.x + 0.1 * self.y
+        result = resampling_algos.permutation_correlation_test(
+            self.x, y, n_permutations=100000, batch_size=500, alpha=0.05, random_state=0
+        )
+        self.assertTrue(result["early_stopped"])
+        self.assertLess(result["n_permutations"], 100000)
+        self.assertLess(result["p_value"], 0.05)
+
+    def test_early_stop_small_sample_default_blocks(self):
+        from py_stats_toolkit.algorithms.correlation import compute_correlation_test
+
+        rng = np.random.default_rng(13)
+        x, y = rng.normal(size=20), rng.normal(size=20)
+        result = resampling_algos.permutation_correlation_test(
+            x, y, n_permutations=9999, alpha=0.05, random_state=0
+        )
+        self.assertTrue(result["early_stopped"])
+        self.assertLessEqual(result["n_permutations"], resampling_algos.EARLY_STOP_BATCH)
+
+        _, p_value = compute_correlation_test(x, y, n_permutations=9999, alpha=0.05, random_state=0)
+        self.assertEqual(p_value, result["p_value"])
+
+    def test_one_sided(self):
+        greater = resampling_algos.permutation_correlation_test(
+            self.x, self.y, alternative="greater", n_permutations=2000, random_state=1
+        )
+        less = resampling_algos.permutation_correlation_test(
+            self.x, self.y, alternative="less", n_permutations=2000, random_state=1
+        )
+        self.assertAlmostEqual(greater["p_value"] + less["p_value"], 1.0, delta=0.01)
+
+
+if __name__ == "__main__":
+    unittest.main()
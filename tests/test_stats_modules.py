@@ -0,0 +1,173 @@
+"""
+Tests for the module front-ends in py_stats_toolkit.stats.
+"""
+
+import importlib.util
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from sklearn.covariance import oas
+
+STATS_DIR = Path(__file__).resolve().parent.parent / "py_stats_toolkit" / "stats"
+
+
+def load_module(package, name):
+    """Load a module file directly; stats/<package>.py shadows the stats/<package>/ directory."""
+    spec = importlib.util.spec_from_file_location(
+        f"_stats_{package}_{name}", STATS_DIR / package / f"{name}.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+CorrelationModule = load_module("correlation", "CorrelationModule").CorrelationModule
+RegressionModule = load_module("regression", "RegressionModule").RegressionModule
+
+
+class TestCorrelationModule(unittest.TestCase):
+    """Test the CorrelationModule engines and stateful helpers."""
+
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        values = rng.normal(size=(80, 5))
+        values[:, 1] += values[:, 0]
+        self.df = pd.DataFrame(values, columns=list("abcde"))
+        self.module = CorrelationModule()
+
+    def test_array_input_uses_blocked_engine(self):
+        result = self.module.process(self.df.values, block_size=2)
+        self.assertIsInstance(result, np.ndarray)
+        np.testing.assert_allclose(result, np.corrcoef(self.df.values, rowvar=False), atol=1e-12)
+        pairs = self.module.get_correlation_pairs(threshold=0.5)
+        self.assertEqual(pairs[0][:2], (0, 1))
+        with self.assertRaises(ValueError):
+            self.module.process(self.df.values, method="spearman")
+
+    def test_incremental_update(self):
+        self.module.process(self.df.iloc[:50], incremental=True)
+        result = self.module.update(self.df.iloc[50:])
+        pd.testing.assert_frame_equal(result, self.df.corr(), atol=1e-12)
+
+    def test_partial_correlation(self):
+        corr = self.module.process(self.df)
+        precision = np.linalg.inv(corr.values)
+        scale = np.sqrt(np.diag(precision))
+        expected = -precision / np.outer(scale, scale)
+        np.fill_diagonal(expected, 1.0)
+        np.testing.assert_allclose(self.module.get_partial_correlation_matrix().values, expected, atol=1e-10)
+
+        self.module.process(self.df.iloc[:50], incremental=True)
+        self.module.update(self.df.iloc[50:])
+        np.testing.assert_allclose(self.module.get_partial_correlation_matrix().values, expected, atol=1e-10)
+        with self.assertRaises(ValueError):
+            self.module.get_partial_correlation_matrix(shrinkage="ledoit_wolf")
+
+        self.module.process(self.df, incremental=True)
+        shrunk = self.module.get_partial_correlation_matrix(shrinkage="ledoit_wolf")
+        self.assertEqual(list(shrunk.columns), list(self.df.columns))
+        self.assertTrue((np.abs(shrunk.values) <= 1 + 1e-12).all())
+
+    def test_shrinkage(self):
+        result = self.module.process(self.df, shrinkage="oas")
+        covariance = oas(self.df.values)[0]
+        scale = np.sqrt(np.diag(covariance))
+        np.testing.assert_allclose(result.values, covariance / np.outer(scale, scale), atol=1e-10)
+        self.assertIsNone(self.module.accumulator)
+        with self.assertRaises(ValueError):
+            self.module.process(self.df, method="spearman", shrinkage="oas")
+
+    def test_array_input_discards_accumulator(self):
+        self.module.process(self.df, incremental=True)
+        wider = np.column_stack([self.df.values, self.df.values[:, :2] ** 2])
+        self.module.process(wider)
+        self.assertEqual(self.module.get_partial_correlation_matrix().shape, (7, 7))
+        with self.assertRaises(ValueError):
+            self.module.update(wider)
+
+
+class TestRegressionModule(unittest.TestCase):
+    """Test the RegressionModule dispatch beyond single-target fits."""
+
+    def setUp(self):
+        rng = np.random.default_rng(42)
+        self.df = pd.DataFrame(
+            {
+                "x1": rng.normal(size=60),
+                "x2": rng.normal(size=60),
+                "y": rng.normal(size=60),
+            }
+        )
+        self.module = RegressionModule()
+
+    def test_multi_target(self):
+        df = self.df.assign(y2=self.df["y"] + 1e6)
+        result = self.module.process(df, ["x1", "x2"], ["y", "y2"])
+        self.assertEqual(result["targets"], ["y", "y2"])
+        self.assertEqual(result["coefficients"].shape, (2, 2))
+        np.testing.assert_allclose(result["r2_score"][0], result["r2_score"][1], atol=1e-8)
+        with self.assertRaises(ValueError):
+            self.module.process(df, ["x1", "x2"], ["y", "y2"], cov_type="HC3")
+        with self.assertRaises(ValueError):
+            self.module.process(df, ["x1", "x2"], ["y", "y2"], group_col="x1")
+
+    def test_group_col(self):
+        df = self.df.assign(store=np.arange(60) % 3)
+        result = self.module.process(df, ["x1", "x2"], "y", group_col="store")
+        self.assertEqual(list(result["coefficients"].index), [0, 1, 2])
+        single = RegressionModule().process(df[df["store"] == 1], ["x1", "x2"], "y")
+        self.assertAlmostEqual(result["intercept"][1], single["intercept"], places=10)
+        predictions = self.module.predict(df[["x1", "x2"]], groups=df["store"])
+        np.testing.assert_allclose(predictions, result["predictions"])
+
+    def test_group_col_rejects_unsupported_options(self):
+        df = self.df.assign(store=np.arange(60) % 3)
+        cases = [
+            ("linear", {"cov_type": "HC0"}),
+            ("linear", {"solver": "qr"}),
+            ("ridge", {"alpha": [0.1, 1.0]}),
+            ("lasso", {"alpha": None}),
+            ("lasso", {"alpha": [0.1, 1.0]}),
+            ("polynomial", {"chunk_rows": 16}),
+        ]
+        for regression_type, options in cases:
+            with self.subTest(regression_type=regression_type, options=options):
+                with self.assertRaises(ValueError):
+                    self.module.process(df, ["x1", "x2"], "y", regression_type=regression_type,
+                                        group_col="store", **options)
+
+    def test_lean_and_keep_data(self):
+        eager = RegressionModule().process(self.df, ["x1", "x2"], "y")
+        lean = self.module.process(self.df, ["x1", "x2"], "y", lean=True)
+        np.testing.assert_allclose(lean["residuals"], eager["residuals"])
+        self.assertIs(self.module.data, self.df)
+
+        released = self.module.process(self.df, ["x1", "x2"], "y", lean=True, keep_data=False)
+        self.assertIsNone(self.module.data)
+        self.assertNotIn("residuals", released)
+        with self.assertRaises(ValueError):
+            self.module.get_residuals_analysis()
+
+    def test_cov_type(self):
+        result = self.module.process(self.df, ["x1", "x2"], "y", cov_type="HC3")
+        table = result["inference"]
+        self.assertEqual(list(table.index), ["intercept", "x1", "x2"])
+        self.assertTrue(((table["p_value"] >= 0) & (table["p_value"] <= 1)).all())
+        with self.assertRaises(ValueError):
+            self.module.process(self.df, ["x1", "x2"], "y", regression_type="ridge", cov_type="HC3")
+
+    def test_finalize_starts_a_new_fit(self):
+        first = self.df.iloc[:30]
+        self.module.partial_fit(first, ["x1", "x2"], "y").finalize()
+        result = self.module.partial_fit(self.df.iloc[30:], ["x1", "x2"], "y").finalize()
+        reference = RegressionModule().process(self.df.iloc[30:], ["x1", "x2"], "y")
+        self.assertEqual(result["n_samples"], 30)
+        for name in ("x1", "x2"):
+            self.assertAlmostEqual(result["coefficients"][name], reference["coefficients"][name], places=10)
+        self.assertIsNone(self.module.accumulator)
+
+
+if __name__ == "__main__":
+    unittest.main()